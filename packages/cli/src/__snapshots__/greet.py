@@ -44,15 +44,17 @@ def greet_params(
 
 def greet_validate(params: typing.Any) -> None:
     """Validate untrusted parameters. Raises StyxValidationError if `params` is not a valid Greet."""
-    if params is None or not isinstance(params, dict):
+    if type(params) is not dict and not isinstance(params, dict):
         raise StyxValidationError(f'Params object has the wrong type \'{type(params)}\'')
-    if params.get("name", None) is None:
+    v_name = params.get("name", None)
+    if v_name is None:
         raise StyxValidationError("`name` must not be None")
-    if not isinstance(params["name"], str):
-        raise StyxValidationError(f'`name` has the wrong type: Received `{type(params["name"])}` expected `str`')
-    if params.get("loud", None) is not None:
-        if not isinstance(params["loud"], bool):
-            raise StyxValidationError(f'`loud` has the wrong type: Received `{type(params["loud"])}` expected `bool`')
+    if type(v_name) is not str and not isinstance(v_name, str):
+        raise StyxValidationError(f'`name` has the wrong type: Received `{type(v_name)}` expected `str`')
+    v_loud = params.get("loud", None)
+    if v_loud is not None:
+        if type(v_loud) is not bool and not isinstance(v_loud, bool):
+            raise StyxValidationError(f'`loud` has the wrong type: Received `{type(v_loud)}` expected `bool`')
 
 def greet_cargs(params: Greet, execution: Execution) -> list[str]:
     """Build command-line arguments from parameters."""
@@ -70,7 +72,7 @@ def greet_outputs(params: Greet, execution: Execution) -> GreetOutputs:
         root=root_v,
     )
 
-def greet_execute(params: Greet, runner: Runner | None = None) -> GreetOutputs:
+def greet_execute(params: Greet, runner: Runner | None = None, _validate: bool = True) -> GreetOutputs:
     """
     greet
 
@@ -79,11 +81,13 @@ def greet_execute(params: Greet, runner: Runner | None = None) -> GreetOutputs:
     Args:
         params: The parameters.
         runner: Command runner (defaults to global runner).
+        _validate: Validate `params` first (pass False for already-trusted params).
 
     Returns:
         Tool outputs (paths to files produced by the tool).
     """
-    greet_validate(params)
+    if _validate:
+        greet_validate(params)
     runner = runner if runner is not None else get_global_runner()
     execution = runner.start_execution(GREET_METADATA)
     execution.params(params)
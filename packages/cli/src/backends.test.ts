@@ -34,4 +34,10 @@ describe("backends", () => {
     expect(backends.map((b) => b.name)).toEqual(["python"]);
     expect(unknown).toEqual(["rust"]);
   });
+
+  it("does not resolve Object.prototype keys as backends", () => {
+    const { backends, unknown } = resolveBackends(["constructor", "toString"]);
+    expect(backends).toEqual([]);
+    expect(unknown).toEqual(["constructor", "toString"]);
+  });
 });
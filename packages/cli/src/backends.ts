@@ -12,27 +12,29 @@ import {
 /**
  * Registry of backends keyed by CLI alias. The alias is what users pass to
  * `-b`; the backend's `name`/`target` is what we use for the output subdir.
+ * A Map (not an object literal) so lookups are a single hash probe and a name
+ * like `constructor` can't resolve through `Object.prototype`.
  */
-const registry: Record<string, () => Backend> = {
-  python: () => new PythonBackend(),
-  typescript: () => new TypeScriptBackend(),
-  ts: () => new TypeScriptBackend(),
-  schema: () => new JsonSchemaBackend(),
-  "json-schema": () => new JsonSchemaBackend(),
-  boutiques: () => new BoutiquesBackend(),
-  argtype: () => new ArgtypeBackend(),
-  nipype: () => new NipypeBackend(),
-  pydra: () => new PydraBackend(),
-};
+const registry: ReadonlyMap<string, () => Backend> = new Map<string, () => Backend>([
+  ["python", () => new PythonBackend()],
+  ["typescript", () => new TypeScriptBackend()],
+  ["ts", () => new TypeScriptBackend()],
+  ["schema", () => new JsonSchemaBackend()],
+  ["json-schema", () => new JsonSchemaBackend()],
+  ["boutiques", () => new BoutiquesBackend()],
+  ["argtype", () => new ArgtypeBackend()],
+  ["nipype", () => new NipypeBackend()],
+  ["pydra", () => new PydraBackend()],
+]);
 
-export const knownBackends = Object.keys(registry);
+export const knownBackends = [...registry.keys()];
 
 export function resolveBackends(names: string[]): { backends: Backend[]; unknown: string[] } {
   const backends: Backend[] = [];
   const seen = new Set<string>();
   const unknown: string[] = [];
   for (const name of names) {
-    const factory = registry[name];
+    const factory = registry.get(name);
     if (!factory) {
       unknown.push(name);
       continue;
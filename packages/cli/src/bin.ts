@@ -5,6 +5,11 @@ import { knownBackends } from "./backends.js";
 import { runBuildCommand, type BuildFlags } from "./command.js";
 import { writeFiles } from "./write.js";
 
+/** Forward buffered output lines to `stream` in a single write. */
+function writeLines(stream: NodeJS.WriteStream, lines: string[]): void {
+  if (lines.length > 0) stream.write(lines.join("\n") + "\n");
+}
+
 const cli = cac("styx");
 
 cli
@@ -23,7 +28,9 @@ cli
   )
   .action((input: string | undefined, flags: BuildFlags) => {
     const result = runBuildCommand(input, flags);
-    for (const line of result.stderr) console.error(line);
+    // A large catalog build can report thousands of warning lines; hand each
+    // stream one joined write instead of a console call per line.
+    writeLines(process.stderr, result.stderr);
     // Write whatever compiled - a catalog build returns partial output alongside
     // a non-zero exit code, and fail-hard paths return an empty file list.
     try {
@@ -32,7 +39,7 @@ cli
       console.error(`error: ${e instanceof Error ? e.message : String(e)}`);
       process.exit(1);
     }
-    for (const line of result.stdout) console.log(line);
+    writeLines(process.stdout, result.stdout);
     if (result.exitCode !== 0) process.exit(result.exitCode);
   });
 
@@ -124,4 +124,79 @@ describe("catalog build: skipping unbuildable tools", () => {
     expect(result.errors.length).toBeGreaterThan(0);
     expect(result.warnings.some((w) => /package omitted/.test(w))).toBe(false);
   });
+
+  it("reports a tool's compile failure once across multiple backends", () => {
+    writeFile("project.json", JSON.stringify({ name: "proj", packages: ["pkg"] }));
+    writeFile("pkg/package.json", JSON.stringify({ name: "pkg", default: "1" }));
+    writeFile("pkg/1/version.json", JSON.stringify({ name: "1", apps: ["broken"] }));
+    writeFile(
+      "pkg/1/broken/app.json",
+      JSON.stringify({ name: "broken", source: { type: "boutiques", path: "missing.json" } }),
+    );
+
+    const result = build({
+      catalog: tmp,
+      out,
+      backends: [new PythonBackend(), new TypeScriptBackend()],
+      mode: "multi",
+    });
+
+    // The read failure is reported once, not once per backend.
+    expect(result.errors.filter((e) => e.includes("missing.json"))).toHaveLength(1);
+    expect(result.stats?.appsFailed).toBe(1);
+  });
+
+  it("emits each tool for every backend from one context before compiling the next", () => {
+    writeFile("project.json", JSON.stringify({ name: "proj", packages: ["pkg"] }));
+    writeFile("pkg/package.json", JSON.stringify({ name: "pkg", default: "1" }));
+    writeFile("pkg/1/version.json", JSON.stringify({ name: "1", apps: ["greet", "wave"] }));
+    writeFile(
+      "pkg/1/greet/app.json",
+      JSON.stringify({ name: "greet", source: { type: "boutiques", path: "d.json" } }),
+    );
+    writeFile("pkg/1/greet/d.json", BOUTIQUES);
+    writeFile(
+      "pkg/1/wave/app.json",
+      JSON.stringify({ name: "wave", source: { type: "boutiques", path: "d.json" } }),
+    );
+    writeFile(
+      "pkg/1/wave/d.json",
+      JSON.stringify({ ...JSON.parse(BOUTIQUES), name: "wave", "command-line": "wave [NAME]" }),
+    );
+
+    // Record, in call order, the context each backend is asked to emit from.
+    const seen: unknown[] = [];
+    class RecordingPython extends PythonBackend {
+      emitApp(...args: Parameters<PythonBackend["emitApp"]>) {
+        seen.push(args[0]);
+        return super.emitApp(...args);
+      }
+    }
+    class RecordingTypeScript extends TypeScriptBackend {
+      emitApp(...args: Parameters<TypeScriptBackend["emitApp"]>) {
+        seen.push(args[0]);
+        return super.emitApp(...args);
+      }
+    }
+
+    const result = build({
+      catalog: tmp,
+      out,
+      backends: [new RecordingPython(), new RecordingTypeScript()],
+      mode: "multi",
+    });
+
+    expect(result.errors).toEqual([]);
+    const paths = relPaths(result.files);
+    expect(paths).toContain("python/pkg/greet.py");
+    expect(paths).toContain("python/pkg/wave.py");
+    expect(paths.some((p) => p.startsWith("typescript/pkg/"))).toBe(true);
+    // Both backends emit a tool from one parse/solve, and are done with it
+    // before the next tool compiles - so no context outlives its tool.
+    expect(seen).toHaveLength(4);
+    expect(seen[1]).toBe(seen[0]);
+    expect(seen[3]).toBe(seen[2]);
+    expect(seen[2]).not.toBe(seen[0]);
+    expect(result.stats).toMatchObject({ appsCompiled: 2, appsFailed: 0 });
+  });
 });
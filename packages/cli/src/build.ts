@@ -8,6 +8,7 @@ import {
   resolveOutputs,
   solve,
   type Backend,
+  type CodegenContext,
   type EmitResult,
   type EmittedApp,
   type EmittedPackage,
@@ -131,11 +132,7 @@ function buildCatalog(catalogPath: string, options: BuildOptions): BuildResult {
   }
   result.warnings.push(...catalog.warnings);
 
-  // Skip/empty warnings are backend-independent, so only the first backend pass
-  // records them - otherwise they'd be duplicated once per backend.
-  options.backends.forEach((backend, i) => {
-    runBackendOverCatalog(backend, catalog, options.mode, options.out, result, i === 0);
-  });
+  runCatalog(catalog, options.backends, options.mode, options.out, result);
   return result;
 }
 
@@ -151,7 +148,7 @@ function readAndCompile(
   pkg: PackageMeta | undefined,
   proj: ProjectMeta | undefined,
   result: BuildResult,
-): ReturnType<typeof createContext> | null {
+): CodegenContext | null {
   let source: string;
   try {
     source = readFileSync(sourcePath, "utf8");
@@ -193,80 +190,104 @@ function readAndCompile(
   }
 }
 
-function runBackendOverCatalog(
-  backend: Backend,
+/** One backend's output state across a catalog build. */
+interface BackendRun {
+  backend: Backend;
+  root: string;
+  packagesEmitted: EmittedPackage[];
+}
+
+/**
+ * Build every tool in the catalog for every backend. Parse, pipeline and solve
+ * are backend-independent, so each tool is compiled once and its context handed
+ * to every backend in turn, then dropped before the next tool compiles - memory
+ * stays bounded by one tool's IR rather than growing with the catalog. Skip and
+ * compile diagnostics and the per-tool stats are therefore recorded once, and
+ * per-backend emit failures are counted for the first backend only so stats
+ * don't multiply with the backend count.
+ */
+function runCatalog(
   catalog: CatalogProject,
+  backends: readonly Backend[],
   mode: BuildMode,
   outRoot: string,
   result: BuildResult,
-  recordWarnings: boolean,
 ): void {
-  const backendRoot = path.resolve(outRoot, backend.target);
-  const packagesEmitted: EmittedPackage[] = [];
+  const runs: BackendRun[] = backends.map((backend) => ({
+    backend,
+    root: path.resolve(outRoot, backend.target),
+    packagesEmitted: [],
+  }));
 
   for (const pkg of catalog.packages) {
     const pkgDir = pkg.meta.name ?? "package";
-    const appsEmitted: EmittedApp[] = [];
+    const pkgRuns = runs.map((run) => ({
+      run,
+      // Every tool and package file in the suite lands under this one
+      // directory, so join it once instead of per emitted file.
+      pkgRoot: path.join(run.root, pkgDir),
+      appsEmitted: [] as EmittedApp[],
+      // One scope shared across every tool in the suite so top-level names stay
+      // unique across the package's flat barrel re-exports.
+      pkgScope: run.backend.newPackageScope?.(),
+    }));
     let skipped = 0;
-    // One scope shared across every tool in the suite so top-level names stay
-    // unique across the package's flat barrel re-exports.
-    const pkgScope = backend.newPackageScope?.();
 
     for (const app of pkg.apps) {
       // A tool can declare a format we have no frontend for yet (e.g. Workbench).
       // Skip it with a warning rather than failing the whole catalog build.
       if (app.sourceFormat && !SUPPORTED_FORMATS.has(app.sourceFormat)) {
         skipped++;
-        if (recordWarnings) {
-          if (result.stats) result.stats.appsSkipped++;
-          result.warnings.push(
-            `${app.sourcePath}: skipped (unsupported source format "${app.sourceFormat}")`,
-          );
-        }
+        if (result.stats) result.stats.appsSkipped++;
+        result.warnings.push(
+          `${app.sourcePath}: skipped (unsupported source format "${app.sourceFormat}")`,
+        );
         continue;
       }
 
       const ctx = readAndCompile(app.sourcePath, app.sourceFormat, pkg.meta, catalog.meta, result);
       if (!ctx) {
-        if (recordWarnings && result.stats) result.stats.appsFailed++;
+        if (result.stats) result.stats.appsFailed++;
         continue;
       }
 
-      // Isolate emit so one tool that makes a backend throw doesn't crash the run.
-      let emitted: EmittedApp;
-      try {
-        emitted = backend.emitApp(ctx, pkgScope);
-      } catch (e) {
-        result.errors.push(`[${backend.name} ${pkg.meta.name}/${app.name}] ${errMsg(e)}`);
-        if (recordWarnings && result.stats) result.stats.appsFailed++;
-        continue;
-      }
-      appendEmitMessages(result, emitted, backend, `${pkg.meta.name}/${app.name}`);
-      appsEmitted.push(emitted);
-      if (recordWarnings && result.stats) result.stats.appsCompiled++;
+      pkgRuns.forEach(({ run, pkgRoot, appsEmitted, pkgScope }, i) => {
+        const { backend } = run;
+        // Isolate emit so one tool that makes a backend throw doesn't crash the run.
+        let emitted: EmittedApp;
+        try {
+          emitted = backend.emitApp(ctx, pkgScope);
+        } catch (e) {
+          result.errors.push(`[${backend.name} ${pkg.meta.name}/${app.name}] ${errMsg(e)}`);
+          if (i === 0 && result.stats) result.stats.appsFailed++;
+          return;
+        }
+        appendEmitMessages(result, emitted, backend, `${pkg.meta.name}/${app.name}`);
+        appsEmitted.push(emitted);
+        if (i === 0 && result.stats) result.stats.appsCompiled++;
 
-      for (const [name, content] of emitted.files) {
-        result.files.push({ path: path.join(backendRoot, pkgDir, name), content });
-      }
+        for (const [name, content] of emitted.files) {
+          result.files.push({ path: path.join(pkgRoot, name), content });
+        }
+      });
     }
 
     // A suite whose every tool was skipped (e.g. all-Workbench) emits nothing;
     // don't synthesize an empty package or wire it into the project metadata.
     // Only warn when emptiness is due to skips - genuine failures already errored.
-    if (appsEmitted.length === 0) {
-      if (recordWarnings && skipped > 0 && skipped === pkg.apps.length) {
-        result.warnings.push(`${pkgDir}: all ${skipped} tool(s) skipped, package omitted`);
-      }
-      continue;
+    if (skipped > 0 && skipped === pkg.apps.length) {
+      result.warnings.push(`${pkgDir}: all ${skipped} tool(s) skipped, package omitted`);
     }
 
-    if (mode !== "scripts" && backend.emitPackage) {
+    for (const { run, pkgRoot, appsEmitted } of pkgRuns) {
+      const { backend } = run;
+      if (appsEmitted.length === 0 || mode === "scripts" || !backend.emitPackage) continue;
       try {
         const pkgEmit = backend.emitPackage(pkg.meta, appsEmitted);
         appendEmitMessages(result, pkgEmit, backend, pkg.meta.name);
-        packagesEmitted.push(pkgEmit);
+        run.packagesEmitted.push(pkgEmit);
         for (const [name, content] of pkgEmit.files) {
-          result.files.push({ path: path.join(backendRoot, pkgDir, name), content });
+          result.files.push({ path: path.join(pkgRoot, name), content });
         }
       } catch (e) {
         result.errors.push(`[${backend.name} ${pkgDir}] package emit failed: ${errMsg(e)}`);
@@ -274,12 +295,14 @@ function runBackendOverCatalog(
     }
   }
 
-  if (mode === "multi" && backend.emitProject && packagesEmitted.length > 0) {
+  if (mode !== "multi") return;
+  for (const { backend, root, packagesEmitted } of runs) {
+    if (!backend.emitProject || packagesEmitted.length === 0) continue;
     try {
       const projEmit = backend.emitProject(catalog.meta, packagesEmitted);
       appendEmitMessages(result, projEmit, backend, catalog.meta.name);
       for (const [name, content] of projEmit.files) {
-        result.files.push({ path: path.join(backendRoot, name), content });
+        result.files.push({ path: path.join(root, name), content });
       }
     } catch (e) {
       result.errors.push(`[${backend.name}] project emit failed: ${errMsg(e)}`);
@@ -129,7 +129,16 @@ function loadApp(appDir: string, warnings?: string[]): CatalogApp | null {
   };
 }
 
-function loadVersion(versionDir: string, warnings?: string[]): CatalogPackage | null {
+/**
+ * Load one version directory. `parent` is the already-parsed enclosing
+ * `package.json` when the caller walked down from a package, so it isn't read
+ * and parsed a second time; otherwise it is looked up next to the version dir.
+ */
+function loadVersion(
+  versionDir: string,
+  warnings?: string[],
+  parent?: PackageJson,
+): CatalogPackage | null {
   const versionPath = path.join(versionDir, "version.json");
   if (!exists(versionPath)) return null;
   const version = readJson<VersionJson>(versionPath);
@@ -146,15 +155,12 @@ function loadVersion(versionDir: string, warnings?: string[]): CatalogPackage |
   }
 
   // Try to enrich with the parent package.json if there is one (package > version layout).
-  const parentPkg = path.join(versionDir, "..", "package.json");
-  let pkgName: string | undefined;
-  let pkgDoc: Documentation | undefined;
-  if (exists(parentPkg)) {
-    const pkg = readJson<PackageJson>(parentPkg);
-    pkgName = pkg.name;
-    pkgDoc = pkg.docs;
+  if (!parent) {
+    const parentPkg = path.join(versionDir, "..", "package.json");
+    if (exists(parentPkg)) parent = readJson<PackageJson>(parentPkg);
   }
-  pkgName ??= path.basename(path.dirname(versionDir));
+  const pkgName = parent?.name ?? path.basename(path.dirname(versionDir));
+  const pkgDoc = parent?.docs;
 
   return {
     meta: {
@@ -177,7 +183,7 @@ function loadPackage(pkgDir: string, warnings?: string[]): CatalogPackage | null
   const versionDir = path.join(pkgDir, versionName);
   if (!isDir(versionDir)) return null;
 
-  const loaded = loadVersion(versionDir, warnings);
+  const loaded = loadVersion(versionDir, warnings, pkg);
   if (!loaded) return null;
 
   return {
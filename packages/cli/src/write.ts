@@ -16,9 +16,16 @@ export function writeFiles(files: BuiltFile[]): void {
     byPath.set(file.path, file.content);
   }
 
+  // Many files share a directory (every tool module in a suite), so create each
+  // distinct parent once instead of issuing a recursive mkdir per file.
+  const madeDirs = new Set<string>();
   for (const [dest, content] of byPath) {
     try {
-      mkdirSync(path.dirname(dest), { recursive: true });
+      const dir = path.dirname(dest);
+      if (!madeDirs.has(dir)) {
+        mkdirSync(dir, { recursive: true });
+        madeDirs.add(dir);
+      }
       writeFileSync(dest, content, "utf8");
     } catch (e) {
       throw new Error(`failed to write ${dest}: ${e instanceof Error ? e.message : String(e)}`);
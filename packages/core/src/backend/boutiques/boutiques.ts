@@ -505,7 +505,7 @@ class BoutiquesEmitter {
     fieldType: BoundType,
     valueKey: string,
     peeled: PeeledInput,
-    fieldInfo: Map<string, { doc?: string; defaultValue?: string | number | boolean }>,
+    fieldInfo: ReadonlyMap<string, { doc?: string; defaultValue?: string | number | boolean }>,
     wrapperNode: Expr,
   ): BtInput {
     const info = fieldInfo.get(binding.name);
@@ -36,6 +36,14 @@ describe("CodeBuilder", () => {
     expect(cb.toString()).toBe("a\n    b\n        c");
   });
 
+  it("emits several lines at the current indentation", () => {
+    const cb = new CodeBuilder();
+    cb.line("[");
+    cb.indent(() => cb.lines(['"a",', '"b",']));
+    cb.line("]");
+    expect(cb.toString()).toBe('[\n    "a",\n    "b",\n]');
+  });
+
   it("emits blank lines", () => {
     const cb = new CodeBuilder();
     cb.line("a").blank().line("b");
@@ -1,7 +1,8 @@
 /** Line-buffer abstraction for code emission. */
 export class CodeBuilder {
-  private readonly lines: string[] = [];
-  private depth = 0;
+  private readonly buf: string[] = [];
+  /** Indentation for the current depth, rebuilt only when the depth changes. */
+  private prefix = "";
   private readonly indentStr: string;
 
   constructor(indent = "    ") {
@@ -10,13 +11,19 @@ export class CodeBuilder {
 
   /** Append a line at the current indentation level. */
   line(text: string): this {
-    this.lines.push(this.indentStr.repeat(this.depth) + text);
+    this.buf.push(this.prefix + text);
+    return this;
+  }
+
+  /** Append several lines at the current indentation level. */
+  lines(texts: Iterable<string>): this {
+    for (const text of texts) this.buf.push(this.prefix + text);
     return this;
   }
 
   /** Append a blank line. */
   blank(): this {
-    this.lines.push("");
+    this.buf.push("");
     return this;
   }
 
@@ -27,23 +34,28 @@ export class CodeBuilder {
 
   /** Run a callback with increased indentation. */
   indent(fn: () => void): this {
-    this.depth++;
+    const outer = this.prefix;
+    this.prefix = outer + this.indentStr;
     fn();
-    this.depth--;
+    this.prefix = outer;
     return this;
   }
 
   /** Append all lines from another CodeBuilder at the current indentation level. */
   append(other: CodeBuilder): this {
-    const prefix = this.indentStr.repeat(this.depth);
-    for (const line of other.lines) {
-      this.lines.push(line === "" ? "" : prefix + line);
+    for (const line of other.buf) {
+      this.buf.push(line === "" ? "" : this.prefix + line);
     }
     return this;
   }
 
+  /** Return the built lines, for splicing into an enclosing builder. */
+  toLines(): readonly string[] {
+    return this.buf;
+  }
+
   /** Return the built code as a string. */
   toString(): string {
-    return this.lines.join("\n");
+    return this.buf.join("\n");
   }
 }
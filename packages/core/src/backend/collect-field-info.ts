@@ -2,6 +2,7 @@ import type { BoundType } from "../bindings/index.js";
 import type { CodegenContext } from "../manifest/index.js";
 import { findDoc } from "./find-doc.js";
 import { findStructNode } from "./find-struct-node.js";
+import { memoPerContext } from "./memo.js";
 import { resolveFieldBinding } from "./resolve-field-binding.js";
 
 /**
@@ -15,18 +16,27 @@ export interface FieldInfo {
   defaultValue?: string | number | boolean;
 }
 
+type StructType = Extract<BoundType, { kind: "struct" }>;
+
 /**
  * Collect field metadata (doc, defaultValue) for each field of a struct type.
  *
  * Walks the IR tree to find the sequence node containing the struct's fields,
  * then resolves each child to its field binding. Metadata is recovered from both
  * the wrapper node (where the parser hoists doc) and the binding node (where the
- * solver places the binding after sequence collapse).
+ * solver places the binding after sequence collapse). Several emitters ask for
+ * the same struct, so the result is memoized per context (`memoPerContext`).
  */
 export function collectFieldInfo(
   ctx: CodegenContext,
-  structType: Extract<BoundType, { kind: "struct" }>,
-): Map<string, FieldInfo> {
+  structType: StructType,
+): ReadonlyMap<string, FieldInfo> {
+  return memoPerContext(ctx, [collectFieldInfo, structType], () =>
+    computeFieldInfo(ctx, structType),
+  );
+}
+
+function computeFieldInfo(ctx: CodegenContext, structType: StructType): Map<string, FieldInfo> {
   const info = new Map<string, FieldInfo>();
 
   const structNode = findStructNode(ctx.expr, ctx, structType);
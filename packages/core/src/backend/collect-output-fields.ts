@@ -2,6 +2,7 @@ import type { BindingId, GateAtom, ResolvedOutput } from "../bindings/index.js";
 import { outputGate } from "../bindings/index.js";
 import type { Documentation, Expr } from "../ir/index.js";
 import type { CodegenContext } from "../manifest/index.js";
+import { memoPerContext } from "./memo.js";
 
 /**
  * Language-agnostic collection of a tool's Outputs object: the set of output
@@ -178,8 +179,16 @@ export function hasStreamOutputs(ctx: CodegenContext): boolean {
  * binding's solver-assigned gate fully encodes its ancestry (optional/variant/
  * iterated), so `outputGate([], ...)` yields the correct shape and gating for
  * free - no scope bucket needed.
+ *
+ * The full-tree walk is asked for repeatedly while emitting one tool (field
+ * collection, id dodging, `hasMutableInputs`, the outputs builders), so it is
+ * memoized per context (`memoPerContext`).
  */
-export function collectMutableOutputs(ctx: CodegenContext): EmittedOutput[] {
+export function collectMutableOutputs(ctx: CodegenContext): readonly EmittedOutput[] {
+  return memoPerContext(ctx, [collectMutableOutputs], () => computeMutableOutputs(ctx));
+}
+
+function computeMutableOutputs(ctx: CodegenContext): EmittedOutput[] {
   const out: EmittedOutput[] = [];
   const seen = new Set<BindingId>();
   const walk = (node: Expr, inheritedDoc?: Documentation): void => {
@@ -0,0 +1,66 @@
+import type { CodegenContext } from "../manifest/index.js";
+
+type MemoTrie = Map<unknown, unknown>;
+
+/** Trie slot holding the memoized value of the key path that reaches it. */
+const VALUE = Symbol("value");
+
+const contextMemos = new WeakMap<CodegenContext, MemoTrie>();
+
+/**
+ * Memoize `compute()` per context and `key`. Backend analyses are asked for the
+ * same answer by several emitters (and, in a catalog build, by every backend
+ * sharing the context). Neither the IR nor the solved types change after
+ * `createContext`, so each result is computed once per (context, key).
+ *
+ * `key` is a path of identity-compared parts; lead with the memoized function
+ * itself so call sites never collide. Entries live as long as the context.
+ * Memoized values are shared between callers and must not be mutated.
+ */
+export function memoPerContext<T>(
+  ctx: CodegenContext,
+  key: readonly unknown[],
+  compute: () => T,
+): T {
+  let node = contextMemos.get(ctx);
+  if (node === undefined) {
+    node = new Map();
+    contextMemos.set(ctx, node);
+  }
+  for (const part of key) {
+    let next = node.get(part) as MemoTrie | undefined;
+    if (next === undefined) {
+      next = new Map();
+      node.set(part, next);
+    }
+    node = next;
+  }
+  if (node.has(VALUE)) return node.get(VALUE) as T;
+  const value = compute();
+  node.set(VALUE, value);
+  return value;
+}
+
+/** Default entry cap for `boundedMemo`. */
+const BOUNDED_MEMO_MAX = 4096;
+
+/**
+ * Memoize a pure function of a string across a whole process. Names and doc
+ * texts recur heavily within and across builds, so rendering them once pays,
+ * but a long-lived process building many catalogs would grow an unbounded
+ * cache without limit: once `max` entries are held the cache is cleared and
+ * refilled. Memoized values are shared between callers and must not be mutated.
+ */
+export function boundedMemo<T>(
+  compute: (key: string) => T,
+  max = BOUNDED_MEMO_MAX,
+): (key: string) => T {
+  const cache = new Map<string, T>();
+  return (key) => {
+    if (cache.has(key)) return cache.get(key) as T;
+    const value = compute(key);
+    if (cache.size >= max) cache.clear();
+    cache.set(key, value);
+    return value;
+  };
+}
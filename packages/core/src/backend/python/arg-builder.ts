@@ -11,8 +11,13 @@ import { pyStr, renderAccess, renderPyLiteral } from "./typemap.js";
 interface Expr_ {
   expr: string;
 }
+/**
+ * Statement-shaped result, kept as its lines (relative to the block it lands
+ * in) so each enclosing block re-indents them as it nests them, instead of
+ * joining to a string that the next level up splits apart again.
+ */
 interface Stmt {
-  stmt: string;
+  lines: readonly string[];
 }
 export type ArgResult = Expr_ | Stmt;
 
@@ -20,20 +25,22 @@ function isExpr(r: ArgResult): r is Expr_ {
   return "expr" in r;
 }
 
-export function resultToStmt(r: ArgResult): string {
-  return isExpr(r) ? `cargs.append(${r.expr})` : r.stmt;
+/** The statement lines a result contributes to its block. */
+export function resultLines(r: ArgResult): readonly string[] {
+  return isExpr(r) ? [`cargs.append(${r.expr})`] : r.lines;
 }
 
-function appendLines(cb: CodeBuilder, code: string): void {
-  // Every caller emits `code` as an indented branch body (an `if`/`elif`/`else`
+function appendLines(cb: CodeBuilder, lines: readonly string[]): void {
+  // Every caller emits `lines` as an indented branch body (an `if`/`elif`/`else`
   // or optional block). A union variant or optional can legitimately contribute
-  // no command-line arguments (e.g. an "off"/"none" mode), leaving `code` empty -
-  // emit `pass` so the block is valid Python instead of an empty, un-indented one.
-  if (code.trim() === "") {
+  // no command-line arguments (e.g. an "off"/"none" mode), leaving only blank
+  // lines or none - emit `pass` so the block is valid Python instead of an
+  // empty, un-indented one.
+  if (lines.every((line) => line.trim() === "")) {
     cb.line("pass");
     return;
   }
-  for (const line of code.split("\n")) cb.line(line);
+  cb.lines(lines);
 }
 
 // -- Type helpers --
@@ -212,12 +219,12 @@ function walkSequence(
   const parts = node.attrs.nodes.map((child) => walk(child, ctx, childArg));
 
   if (join !== undefined) {
-    const exprs = parts.map((p) => (isExpr(p) ? p.expr : p.stmt));
+    const exprs = parts.map((p) => (isExpr(p) ? p.expr : p.lines.join("\n")));
     if (exprs.length === 1) return { expr: exprs[0]! };
     return { expr: `${pyStr(join)}.join([${exprs.join(", ")}])` };
   }
 
-  return { stmt: parts.map(resultToStmt).join("\n") };
+  return { lines: parts.flatMap(resultLines) };
 }
 
 function walkOptional(
@@ -237,16 +244,16 @@ function walkOptional(
   // safe, and mypy can narrow the local (it cannot narrow a re-subscript or a
   // fresh `.get()`). Bool-flag optionals are also `NotRequired` (default false),
   // so the truthy guard reads via `.get()` too (absent key -> None -> flag off).
+  //
+  // Both cases read the same `.get()` access, so render it once: the nullable
+  // case binds it to the local, the bool-flag case tests it directly.
+  const getAccess = accessOf(binding, arg, { finalGet: true });
   let childArg = arg;
   let local: string | undefined;
-  let getAccess: string | undefined;
   if (isOpt) {
     local = `v_${optVarCounter++}`;
-    getAccess = accessOf(binding, arg, { finalGet: true });
     childArg = { ...arg, valueSubst: new Map(arg.valueSubst).set(access, local) };
   }
-  // Absent-safe truthy guard for the bool-flag case.
-  const boolGuard = accessOf(binding, arg, { finalGet: true });
 
   // The inner node's access path is solver-assigned (it either inherits this
   // optional's path on a collapse, or scopes into it for a struct); we thread the
@@ -260,20 +267,20 @@ function walkOptional(
       // (which references `local`) only evaluates when the key is present.
       return { expr: `(${inner.expr} if (${local} := ${getAccess}) is not None else "")` };
     }
-    return { expr: `(${inner.expr} if ${boolGuard} else "")` };
+    return { expr: `(${inner.expr} if ${getAccess} else "")` };
   }
 
   const cb = new CodeBuilder("    ");
-  const innerStmt = resultToStmt(inner);
+  const innerLines = resultLines(inner);
   if (isOpt) {
     cb.line(`${local} = ${getAccess}`);
     cb.line(`if ${local} is not None:`);
-    cb.indent(() => appendLines(cb, innerStmt));
+    cb.indent(() => appendLines(cb, innerLines));
   } else {
-    cb.line(`if ${boolGuard}:`);
-    cb.indent(() => appendLines(cb, innerStmt));
+    cb.line(`if ${getAccess}:`);
+    cb.indent(() => appendLines(cb, innerLines));
   }
-  return { stmt: cb.toString() };
+  return { lines: cb.toLines() };
 }
 
 function walkRepeat(
@@ -300,8 +307,8 @@ function walkRepeat(
     }
     const cb = new CodeBuilder("    ");
     cb.line(`for ${v} in range(${access}):`);
-    cb.indent(() => appendLines(cb, resultToStmt(inner)));
-    return { stmt: cb.toString() };
+    cb.indent(() => appendLines(cb, resultLines(inner)));
+    return { lines: cb.toLines() };
   }
 
   // List repeat: emit a for-in loop or generator-join. The loop variable is
@@ -323,8 +330,8 @@ function walkRepeat(
 
   const cb = new CodeBuilder("    ");
   cb.line(`for ${loopVar} in ${access}:`);
-  cb.indent(() => appendLines(cb, resultToStmt(inner)));
-  return { stmt: cb.toString() };
+  cb.indent(() => appendLines(cb, resultLines(inner)));
+  return { lines: cb.toLines() };
 }
 
 function walkAlternative(
@@ -373,12 +380,12 @@ function walkAlternative(
     }
     const cb = new CodeBuilder("    ");
     cb.line(`if ${access}:`);
-    cb.indent(() => appendLines(cb, resultToStmt(variants[0]!)));
+    cb.indent(() => appendLines(cb, resultLines(variants[0]!)));
     if (variants[1]) {
       cb.line(`else:`);
-      cb.indent(() => appendLines(cb, resultToStmt(variants[1]!)));
+      cb.indent(() => appendLines(cb, resultLines(variants[1]!)));
     }
-    return { stmt: cb.toString() };
+    return { lines: cb.toLines() };
   }
 
   if (binding.type.kind === "union") {
@@ -417,21 +424,21 @@ function walkAlternative(
       structVars.forEach(({ variant, i }, k) => {
         const keyword = k === 0 ? "if" : "elif";
         cb.line(`${keyword} ${access}["@type"] == ${pyStr(variant.name ?? "")}:`);
-        cb.indent(() => appendLines(cb, resultToStmt(variants[i]!)));
+        cb.indent(() => appendLines(cb, resultLines(variants[i]!)));
       });
     };
     if (!hasLiteral) {
       emitStructDispatch();
-      return { stmt: cb.toString() };
+      return { lines: cb.toLines() };
     }
     // Mixed union: branch on runtime shape (dict -> `@type` dispatch; else a
     // bare literal used directly), mirroring the validator.
     cb.line(`if isinstance(${access}, dict):`);
     cb.indent(emitStructDispatch);
     cb.line(`else:`);
-    cb.indent(() => appendLines(cb, resultToStmt({ expr: `str(${access})` })));
-    return { stmt: cb.toString() };
+    cb.indent(() => appendLines(cb, resultLines({ expr: `str(${access})` })));
+    return { lines: cb.toLines() };
   }
 
-  return { stmt: variants.map(resultToStmt).join("\n") };
+  return { lines: variants.flatMap(resultLines) };
 }
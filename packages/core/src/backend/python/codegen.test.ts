@@ -700,7 +700,7 @@ describe("PythonBackend", () => {
     const init = backend.emitPackage({ name: "fsl" }, apps).files.get("__init__.py")!;
     expect(init).toContain("from styxdefs import Runner");
     expect(init).toContain(
-      "def execute(params: dict[str, typing.Any], runner: Runner | None = None) -> typing.Any:",
+      "def execute(params: dict[str, typing.Any], runner: Runner | None = None, _validate: bool = True) -> typing.Any:",
     );
     expect(init).toContain('"fsl/bet": bet_execute,');
     expect(init).toContain('"fsl/flirt": flirt_execute,');
@@ -715,6 +715,14 @@ describe("PythonBackend", () => {
     expect(init).not.toContain("def execute(");
   });
 
+  it("generatePackageInit imports each module once", () => {
+    const init = generatePackageInit([
+      { meta: { id: "bet" }, files: new Map(), errors: [], warnings: [] },
+      { meta: { id: "bet" }, files: new Map(), errors: [], warnings: [] },
+    ]);
+    expect(init.split("from .bet import *").length - 1).toBe(1);
+  });
+
   it("generatePackageInit sorts modules alphabetically", () => {
     const init = generatePackageInit([
       { meta: { id: "zeta" }, files: new Map(), errors: [], warnings: [] },
@@ -739,7 +747,14 @@ describe("Python generation - params factory & kwarg wrapper", () => {
 
   it("renames the dict-style wrapper to `<tool>_execute`", () => {
     const code = generate(seq(lit("greet"), str("name")), { app: { id: "greet" } });
-    expect(code).toContain("def greet_execute(params: Greet, runner: Runner | None = None)");
+    expect(code).toContain(
+      "def greet_execute(params: Greet, runner: Runner | None = None, _validate: bool = True)",
+    );
+  });
+
+  it("lets trusted callers skip validation via `_validate=False`", () => {
+    const code = generate(seq(lit("greet"), str("name")), { app: { id: "greet" } });
+    expect(code).toContain("if _validate:\n        greet_validate(params)");
   });
 
   it("emits a kwarg `<tool>` wrapper that calls the factory then execute", () => {
@@ -1,11 +1,12 @@
 import type { BoundType } from "../../bindings/index.js";
 import type { CodegenContext } from "../../manifest/index.js";
 import { CodeBuilder } from "../code-builder.js";
+import { boundedMemo } from "../memo.js";
 import type { SigEntry, SigOptions } from "../sig-entries.js";
 import { snakeCase } from "../string-case.js";
 import { structKey, unionKey } from "../type-keys.js";
 import type { ArgResult } from "./arg-builder.js";
-import { buildArgs, resultToStmt } from "./arg-builder.js";
+import { buildArgs, resultLines } from "./arg-builder.js";
 import { mapType, pyStr, renderPyLiteral } from "./typemap.js";
 import type { NamedType } from "./types.js";
 import { collectFieldInfo, resolveTypeName } from "./types.js";
@@ -17,36 +18,41 @@ import { collectFieldInfo, resolveTypeName } from "./types.js";
  */
 export function emitDocstring(cb: CodeBuilder, text?: string): void {
   if (!text) return;
+  cb.lines(docstringLines(text));
+}
+
+// Docstring texts recur heavily within a build (the fixed `_cargs`/Outputs
+// blurbs in every module, the same field doc shared across a suite's tools),
+// so the escaped/split rendering is memoized per text.
+const docstringLines = boundedMemo((text: string): readonly string[] => {
   // Escape embedded triple-quotes so a `"""` in the text can't close the
   // docstring early.
   const escaped = text.replace(/"""/g, '\\"\\"\\"');
   const lines = escaped.split("\n");
   // Single-line form only when safe: no embedded quote, and no trailing
   // backslash (which would escape the closing quotes, e.g. `"""x\"""`).
-  if (lines.length === 1 && !lines[0]!.includes('"') && !lines[0]!.endsWith("\\")) {
-    cb.line(`"""${lines[0]}"""`);
-    return;
-  }
-  cb.line(`"""`);
-  for (const line of lines) cb.line(line);
-  cb.line(`"""`);
-}
+  return lines.length === 1 && !lines[0]!.includes('"') && !lines[0]!.endsWith("\\")
+    ? [`"""${lines[0]}"""`]
+    : [`"""`, ...lines, `"""`];
+});
+
+// Every tool emits an Outputs object, so OutputPathType is always needed.
+// (Kept last to preserve the previously emitted import order.) The import list
+// is fixed, so the line is joined once rather than per module.
+const STYXDEFS_IMPORT = `from styxdefs import ${[
+  "Execution",
+  "InputPathType",
+  "Metadata",
+  "Runner",
+  "StyxValidationError",
+  "OutputPathType",
+].join(", ")}, get_global_runner`;
 
 export function emitImports(cb: CodeBuilder): void {
   cb.line("import pathlib");
   cb.line("import typing");
   cb.blank();
-  // Every tool emits an Outputs object, so OutputPathType is always needed.
-  // (Kept last to preserve the previously emitted import order.)
-  const fromStyxdefs = [
-    "Execution",
-    "InputPathType",
-    "Metadata",
-    "Runner",
-    "StyxValidationError",
-    "OutputPathType",
-  ];
-  cb.line(`from styxdefs import ${fromStyxdefs.join(", ")}, get_global_runner`);
+  cb.line(STYXDEFS_IMPORT);
 }
 
 export function emitMetadata(ctx: CodegenContext, metaConst: string, cb: CodeBuilder): void {
@@ -353,19 +359,29 @@ export function emitBuildCargs(
     return;
   }
 
-  const argsCode = resultToStmt(result);
-
   cb.line(`def ${funcName}(params: ${paramsType}, execution: Execution) -> list[str]:`);
   cb.indent(() => {
     emitDocstring(cb, "Build command-line arguments from parameters.");
     cb.line("cargs: list[str] = []");
-    for (const line of argsCode.split("\n")) {
+    // Blank lines (from statements that emit nothing) are dropped at any depth.
+    for (const line of resultLines(result)) {
       if (line.trim()) cb.line(line);
     }
     cb.line("return cargs");
   });
 }
 
+// Constant lines of every wrapper body, shared across apps.
+const RUNNER_DECLARE = "runner = runner if runner is not None else get_global_runner()";
+const EXECUTION_PARAMS = "execution.params(params)";
+const WRAPPER_ARGS_DOC = [
+  "Args:",
+  "    params: The parameters.",
+  "    runner: Command runner (defaults to global runner).",
+];
+const VALIDATE_ARG_DOC =
+  "    _validate: Validate `params` first (pass False for already-trusted params).";
+
 export function emitWrapperFunction(
   ctx: CodegenContext,
   paramsType: string,
@@ -382,7 +398,12 @@ export function emitWrapperFunction(
   const appDoc = ctx.app?.doc;
   const returnType = emitOutputs && outputsType ? outputsType : "None";
 
-  cb.line(`def ${funcName}(params: ${paramsType}, runner: Runner | None = None) -> ${returnType}:`);
+  // `_validate` is underscore-prefixed so it can never shadow a generated
+  // module symbol (the id-less validator is literally named `validate`).
+  const validateArg = validateFunc ? ", _validate: bool = True" : "";
+  cb.line(
+    `def ${funcName}(params: ${paramsType}, runner: Runner | None = None${validateArg}) -> ${returnType}:`,
+  );
   cb.indent(() => {
     cb.line('"""');
     let hasContent = false;
@@ -406,19 +427,22 @@ export function emitWrapperFunction(
       hasContent = true;
     }
     if (hasContent) cb.blank();
-    cb.line("Args:");
-    cb.line("    params: The parameters.");
-    cb.line("    runner: Command runner (defaults to global runner).");
+    for (const line of WRAPPER_ARGS_DOC) cb.line(line);
+    if (validateFunc) cb.line(VALIDATE_ARG_DOC);
     cb.blank();
     cb.line("Returns:");
     cb.line(emitOutputs ? "    Tool outputs (paths to files produced by the tool)." : "    None.");
     cb.line('"""');
     // Validate the params dict first (the kwarg wrapper delegates here, so it
     // gets validation transitively; the statically-typed kwargs don't need it).
-    if (validateFunc) cb.line(`${validateFunc}(params)`);
-    cb.line("runner = runner if runner is not None else get_global_runner()");
+    // Callers holding params they already trust can opt out with `_validate=False`.
+    if (validateFunc) {
+      cb.line("if _validate:");
+      cb.indent(() => cb.line(`${validateFunc}(params)`));
+    }
+    cb.line(RUNNER_DECLARE);
     cb.line(`execution = runner.start_execution(${metaConst})`);
-    cb.line("execution.params(params)");
+    cb.line(EXECUTION_PARAMS);
     // Local names `args`/`out` avoid colliding with the module-level `cargs`
     // and `outputs` functions when they share generic names.
     cb.line(`args = ${cargsFunc}(params, execution)`);
@@ -7,6 +7,7 @@ const REQUIRES_PYTHON = ">=3.10";
 const BUILD_SYSTEM = `[build-system]
 requires = ["setuptools>=61"]
 build-backend = "setuptools.build_meta"`;
+const STYXDEFS_DEPENDENCY = `  "styxdefs${STYXDEFS_COMPAT.python}",`;
 
 /** Escape a value for embedding in a TOML basic string. */
 function tomlStr(s: string): string {
@@ -103,7 +104,7 @@ export function generateSubPyproject(
   cb.line(`authors = ${authorsField(pkg.doc ?? proj.doc)}`);
   cb.line(`requires-python = "${REQUIRES_PYTHON}"`);
   cb.line("dependencies = [");
-  cb.line(`  "styxdefs${STYXDEFS_COMPAT.python}",`);
+  cb.line(STYXDEFS_DEPENDENCY);
   cb.line("]");
   cb.blank();
   cb.line("[tool.setuptools]");
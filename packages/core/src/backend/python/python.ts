@@ -514,9 +514,7 @@ function generatePythonModule(
     names.wrapper,
   ];
   cb.line("__all__ = [");
-  cb.indent(() => {
-    for (const sym of publicSymbols) cb.line(`"${sym}",`);
-  });
+  cb.indent(() => cb.lines(publicSymbols.map((sym) => `"${sym}",`)));
   cb.line("]");
 
   // `executeName` is the scope-registered symbol actually emitted above, so the
@@ -586,10 +584,14 @@ export function generatePackageInit(apps: EmittedApp[]): string {
     cb.blank();
   }
 
-  const modules = apps
-    .map((a) => appModuleName(a.meta))
-    .filter((name): name is string => !!name)
-    .sort();
+  // Accumulate into a Set so apps sharing a module name yield one import line,
+  // then sort the distinct names once.
+  const moduleSet = new Set<string>();
+  for (const a of apps) {
+    const name = appModuleName(a.meta);
+    if (name) moduleSet.add(name);
+  }
+  const modules = [...moduleSet].sort();
 
   for (const mod of modules) {
     cb.line(`from .${mod} import *`);
@@ -603,30 +605,34 @@ export function generatePackageInit(apps: EmittedApp[]): string {
   return cb.toString();
 }
 
-/** Emit the suite-level `execute(params, runner)` dispatcher over `@type`. */
+/**
+ * Emit the suite-level `execute(params, runner)` dispatcher over `@type`. The
+ * `@type` -> execute table is a module-level constant, built once at import
+ * rather than on every `execute` call. `_validate` is forwarded to the tool's
+ * execute so trusted callers can skip validation through the suite entry too.
+ */
 function emitPackageDispatch(cb: CodeBuilder, dispatch: AppEntrypoint[]): void {
   cb.line(
-    "def execute(params: dict[str, typing.Any], runner: Runner | None = None) -> typing.Any:",
+    "_DISPATCH: dict[str, typing.Callable[[typing.Any, Runner | None, bool], typing.Any]] = {",
+  );
+  cb.indent(() => cb.lines(dispatch.map((e) => `${JSON.stringify(e.type)}: ${e.executeFn},`)));
+  cb.line("}");
+  cb.blank();
+  cb.line(
+    "def execute(params: dict[str, typing.Any], runner: Runner | None = None, _validate: bool = True) -> typing.Any:",
   );
   cb.indent(() => {
     cb.line('"""Run a tool in this package from a params object, routed by its `@type`."""');
-    cb.line("_dispatch: dict[str, typing.Callable[[typing.Any, Runner | None], typing.Any]] = {");
-    cb.indent(() => {
-      for (const e of dispatch) {
-        cb.line(`${JSON.stringify(e.type)}: ${e.executeFn},`);
-      }
-    });
-    cb.line("}");
     // `.get` (not `params["@type"]`) so a missing discriminant surfaces the
     // clean ValueError below instead of a bare KeyError. The `is not None` guard
-    // also narrows `_type` away from None for the typed `_dispatch.get`.
+    // also narrows `_type` away from None for the typed `_DISPATCH.get`.
     cb.line('_type = params.get("@type")');
-    cb.line("_fn = _dispatch.get(_type) if _type is not None else None");
+    cb.line("_fn = _DISPATCH.get(_type) if _type is not None else None");
     cb.line("if _fn is None:");
     cb.indent(() => {
       cb.line(`raise ValueError(f"No tool registered for @type {_type!r}")`);
     });
-    cb.line("return _fn(params, runner)");
+    cb.line("return _fn(params, runner, _validate)");
   });
 }
 
@@ -20,9 +20,9 @@ import { mapType, pyStr } from "./typemap.js";
  * backends inline `_cargs`/`_outputs` too, rather than v1's per-struct
  * dispatch).
  *
- * Constraints checked: presence (required fields), `isinstance`, int/float
- * range, list length, union `@type` membership + per-variant recursion, and
- * nested struct recursion.
+ * Constraints checked: presence (required fields), type (an exact-type fast
+ * path with an `isinstance` fallback), int/float range, list length, union
+ * `@type` membership + per-variant recursion, and nested struct recursion.
  */
 
 type Resolve = (t: BoundType) => string | undefined;
@@ -60,7 +60,7 @@ export function emitValidate(
 
 function emitRoot(e: Emit, rootType: BoundType, rootNode: Expr): void {
   if (rootType.kind === "struct") {
-    e.cb.line("if params is None or not isinstance(params, dict):");
+    e.cb.line(`if ${notInstance("params", "dict")}:`);
     e.cb.indent(() => raise(e, wrongObjectTypeMsg("params")));
     for (const f of structFields(e.ctx, rootType, rootNode)) {
       emitField(e, f.name, f.type, f.node, f.hasDefault, "params");
@@ -84,20 +84,25 @@ function emitField(
   // `@type` and other fixed literals have no user-supplied runtime value.
   if (fieldType.kind === "literal") return;
 
-  const getExpr = `${base}.get(${pyStr(name)}, None)`;
-  const idxExpr = `${base}[${pyStr(name)}]`;
   const expected = expectedType(e, fieldType);
   const valueType = fieldType.kind === "optional" ? fieldType.inner : fieldType;
 
+  // Read the field once into a local: the presence check and every type/range
+  // check below then reuse it instead of re-probing the dict. The `v_` prefix
+  // keeps the local from shadowing a builtin the checks call (a field named
+  // `type`).
+  const local = e.scope.add(`v_${name.replace(/[^A-Za-z0-9_]/g, "_")}`);
+  e.cb.line(`${local} = ${base}.get(${pyStr(name)}, None)`);
+
   // Optionals and defaulted fields/flags accept None (None = "use default"), so
   // gate the body instead of requiring presence.
   if (fieldType.kind === "optional" || hasDefault) {
-    e.cb.line(`if ${getExpr} is not None:`);
-    e.cb.indent(() => emitValue(e, valueType, node, name, idxExpr, expected));
+    e.cb.line(`if ${local} is not None:`);
+    e.cb.indent(() => emitValue(e, valueType, node, name, local, expected));
   } else {
-    e.cb.line(`if ${getExpr} is None:`);
+    e.cb.line(`if ${local} is None:`);
     e.cb.indent(() => raise(e, str("`" + name + "` must not be None")));
-    emitValue(e, valueType, node, name, idxExpr, expected);
+    emitValue(e, valueType, node, name, local, expected);
   }
 }
 
@@ -145,6 +150,23 @@ function emitValue(
       emitListLength(e, node, wireKey, valueExpr);
       const itemNode = findRepeatNode(node)?.attrs.node;
       const elem = e.scope.add("e");
+      const item = type.item;
+      const leaf = leafPyType(item);
+      if (leaf !== undefined) {
+        // Lists of plain scalars (coordinates, indices, names) can be long.
+        // Check exact element types in one `all()` pass; only when that fails
+        // re-walk the list with the full check, which accepts subclasses and
+        // reports the offending element. Numeric bounds are then checked in a
+        // single `any()` pass over the list.
+        const fast = leaf.startsWith("(") ? `type(${elem}) in ${leaf}` : `type(${elem}) is ${leaf}`;
+        e.cb.line(`if not all(${fast} for ${elem} in ${valueExpr}):`);
+        e.cb.indent(() => {
+          e.cb.line(`for ${elem} in ${valueExpr}:`);
+          e.cb.indent(() => checkType(e, elem, leaf, wireKey, expectedType(e, item)));
+        });
+        emitRange(e, itemNode, wireKey, valueExpr, elem);
+        return;
+      }
       e.cb.line(`for ${elem} in ${valueExpr}:`);
       // Report the element type (e.g. `int`), not the list type (`list[int]`).
       e.cb.indent(() =>
@@ -153,7 +175,7 @@ function emitValue(
       return;
     }
     case "struct": {
-      e.cb.line(`if not isinstance(${valueExpr}, dict):`);
+      e.cb.line(`if ${notInstance(valueExpr, "dict")}:`);
       e.cb.indent(() => raise(e, wrongObjectTypeMsg(valueExpr)));
       for (const f of structFields(e.ctx, type, node)) {
         emitField(e, f.name, f.type, f.node, f.hasDefault, valueExpr);
@@ -183,7 +205,7 @@ function emitUnion(
     );
     const allStr = values.every((x) => typeof x === "string");
     checkType(e, valueExpr, allStr ? "str" : "(float, int)", wireKey, expectedType(e, unionType));
-    emitLiteralMembership(e, values, wireKey, valueExpr);
+    emitLiteralMembership(e, values, wireKey, valueExpr, true);
     return;
   }
 
@@ -197,19 +219,25 @@ function emitUnion(
     // `valueExpr` is known to be a dict here.
     e.cb.line(`if "@type" not in ${valueExpr}:`);
     e.cb.indent(() => raise(e, str("Params object is missing `@type`")));
-    const names = structVars
+    const tags = structVars
       .map(({ variant }) => variant.name)
       .filter((n): n is string => n !== undefined)
-      .map((n) => pyStr(n))
-      .join(", ");
-    e.cb.line(`if ${valueExpr}["@type"] not in [${names}]:`);
+      .map((n) => pyStr(n));
+    const names = tags.join(", ");
+    // Read the tag once: the membership check and every arm of the dispatch
+    // chain compare the local instead of re-indexing the dict.
+    const tag = e.scope.add(`t_${wireKey.replace(/[^A-Za-z0-9_]/g, "_")}`);
+    e.cb.line(`${tag} = ${valueExpr}["@type"]`);
+    // The tag is never type-checked (it can be any JSON value), so it must not
+    // be hashed: a list tag would raise `TypeError` instead of failing here.
+    e.cb.line(`if ${tag} not in ${memberCollection(tags, false)}:`);
     e.cb.indent(() =>
       raise(e, str("Parameter `" + wireKey + "`s `@type` must be one of [" + names + "]")),
     );
     structVars.forEach(({ variant, i }, k) => {
       const vt = variant.type as Extract<BoundType, { kind: "struct" }>;
       const keyword = k === 0 ? "if" : "elif";
-      e.cb.line(`${keyword} ${valueExpr}["@type"] == ${pyStr(variant.name ?? "")}:`);
+      e.cb.line(`${keyword} ${tag} == ${pyStr(variant.name ?? "")}:`);
       e.cb.indent(() => {
         const fields = structFields(e.ctx, vt, altNode?.attrs.alts[i]).filter(
           (f) => f.type.kind !== "literal",
@@ -225,37 +253,101 @@ function emitUnion(
 
   // Pure discriminated union: every variant is a struct with an `@type`.
   if (litVariants.length === 0) {
-    e.cb.line(`if not isinstance(${valueExpr}, dict):`);
+    e.cb.line(`if ${notInstance(valueExpr, "dict")}:`);
     e.cb.indent(() => raise(e, wrongObjectTypeMsg(valueExpr)));
     emitStructArm();
     return;
   }
 
   // Mixed union: a value is either a struct (dict with `@type`) or a bare
-  // literal. Branch on the runtime shape.
-  e.cb.line(`if isinstance(${valueExpr}, dict):`);
+  // literal. Branch on the runtime shape, exact-type test first like the
+  // negative checks.
+  e.cb.line(`if type(${valueExpr}) is dict or isinstance(${valueExpr}, dict):`);
   e.cb.indent(emitStructArm);
   e.cb.line("else:");
   e.cb.indent(() => {
     const values = litVariants.map(
       (v) => (v.type as Extract<BoundType, { kind: "literal" }>).value,
     );
-    emitLiteralMembership(e, values, wireKey, valueExpr);
+    // Any non-dict lands here unchecked, so keep the non-hashing form.
+    emitLiteralMembership(e, values, wireKey, valueExpr, false);
   });
 }
 
-/** Emit a `not in [...]` membership check over literal values. */
+/**
+ * Emit a `not in` membership check over literal values. `typeChecked` says
+ * whether the value is already known to be a str/number (see `memberCollection`).
+ */
 function emitLiteralMembership(
   e: Emit,
   values: (string | number)[],
   wireKey: string,
   valueExpr: string,
+  typeChecked: boolean,
 ): void {
-  const rendered = values.map((x) => (typeof x === "string" ? pyStr(x) : pyNum(x))).join(", ");
-  e.cb.line(`if ${valueExpr} not in [${rendered}]:`);
+  const items = values.map((x) => (typeof x === "string" ? pyStr(x) : pyNum(x)));
+  const rendered = items.join(", ");
+  const collection = contiguousIntRange(values) ?? memberCollection(items, typeChecked);
+  e.cb.line(`if ${valueExpr} not in ${collection}:`);
   e.cb.indent(() => raise(e, str("Parameter `" + wireKey + "` must be one of [" + rendered + "]")));
 }
 
+/**
+ * `range(lo, hi + 1)` when the choices are (in any order) every integer from
+ * `lo` to `hi`, e.g. an enum `[0, 1, 2, 3]`. An int membership test on a range
+ * is a bounds compare rather than a scan, and it keeps `in` semantics for any
+ * other value (`1.0` is still a member, `1.5` is not). Only used from three
+ * values up, where it beats scanning the literal.
+ */
+function contiguousIntRange(values: (string | number)[]): string | undefined {
+  if (values.length < 3 || !values.every((v) => typeof v === "number" && Number.isInteger(v))) {
+    return undefined;
+  }
+  const nums = new Set(values as number[]);
+  const lo = Math.min(...nums);
+  const hi = Math.max(...nums);
+  if (hi - lo + 1 !== nums.size) return undefined;
+  return `range(${lo}, ${hi + 1})`;
+}
+
+/** Above this many candidates a membership test hashes instead of scanning. */
+const SET_MEMBERSHIP_MIN = 5;
+
+/**
+ * The literal collection a `not in` test runs against. CPython folds both an
+ * all-constant list and set literal on the right of `in` into a constant (a
+ * tuple and a frozenset), so neither allocates per call; a short list scans
+ * faster than it hashes, while a long choice list (dozens of enum values, or
+ * many union tags) is an O(1) frozenset lookup instead of a linear scan.
+ *
+ * A set lookup hashes its operand, so an unhashable value (a list or dict from
+ * malformed params) would raise `TypeError` rather than fail the test. The set
+ * form is therefore only used when `hashable` - the value has already passed a
+ * str/number type check.
+ */
+function memberCollection(items: string[], hashable: boolean): string {
+  const joined = items.join(", ");
+  return hashable && items.length >= SET_MEMBERSHIP_MIN ? `{${joined}}` : `[${joined}]`;
+}
+
+/** The Python type check for a list item that is a plain scalar, else undefined. */
+function leafPyType(type: BoundType): string | undefined {
+  if (type.kind === "bool") return "bool";
+  if (type.kind !== "scalar") return undefined;
+  switch (type.scalar) {
+    case "str":
+      return "str";
+    case "int":
+      return "int";
+    case "float":
+      return "(float, int)";
+    case "path":
+      // A path is usually a `pathlib.Path` subclass instance, which would always
+      // miss an exact-type pass; keep the per-element loop.
+      return undefined;
+  }
+}
+
 function checkType(
   e: Emit,
   valueExpr: string,
@@ -263,16 +355,47 @@ function checkType(
   wireKey: string,
   expected: string,
 ): void {
-  e.cb.line(`if not isinstance(${valueExpr}, ${pyType}):`);
+  e.cb.line(`if ${notInstance(valueExpr, pyType)}:`);
   e.cb.indent(() => raise(e, wrongTypeMsg(wireKey, valueExpr, expected)));
 }
 
-function emitRange(e: Emit, node: Expr | undefined, wireKey: string, valueExpr: string): void {
+/**
+ * A "value is not an instance of `pyType`" condition with an exact-type fast
+ * path: `type(x) is T` is a pointer compare, while `isinstance` goes through
+ * the full subclass check. Valid input almost always has the exact type, so
+ * the `isinstance` fallback (which keeps subclasses - and `bool` for `int` -
+ * accepted) only runs on the rare path. A tuple `pyType` (`(float, int)`)
+ * uses tuple membership, which compares types by identity first.
+ */
+function notInstance(valueExpr: string, pyType: string): string {
+  const fast = pyType.startsWith("(")
+    ? `type(${valueExpr}) not in ${pyType}`
+    : `type(${valueExpr}) is not ${pyType}`;
+  return `${fast} and not isinstance(${valueExpr}, ${pyType})`;
+}
+
+/**
+ * Emit the numeric range check for `valueExpr`. With `elem`, `valueExpr` is a
+ * (type-checked) list of numbers and each element is checked against the
+ * bounds in one `any()` pass. The chained compare is kept per element rather
+ * than bounding `min()`/`max()`: those skip a NaN that is not first, which the
+ * compare rejects.
+ */
+function emitRange(
+  e: Emit,
+  node: Expr | undefined,
+  wireKey: string,
+  valueExpr: string,
+  elem?: string,
+): void {
   const term = findRangeNode(node);
   if (!term) return;
   const { minValue, maxValue } = term.attrs;
+  const x = elem ?? valueExpr;
+  const cond = (violated: string): string =>
+    elem === undefined ? `if ${violated}:` : `if any(${violated} for ${elem} in ${valueExpr}):`;
   if (minValue !== undefined && maxValue !== undefined) {
-    e.cb.line(`if not (${pyNum(minValue)} <= ${valueExpr} <= ${pyNum(maxValue)}):`);
+    e.cb.line(cond(`not (${pyNum(minValue)} <= ${x} <= ${pyNum(maxValue)})`));
     e.cb.indent(() =>
       raise(
         e,
@@ -280,10 +403,10 @@ function emitRange(e: Emit, node: Expr | undefined, wireKey: string, valueExpr:
       ),
     );
   } else if (minValue !== undefined) {
-    e.cb.line(`if ${valueExpr} < ${pyNum(minValue)}:`);
+    e.cb.line(cond(`${x} < ${pyNum(minValue)}`));
     e.cb.indent(() => raise(e, str(`Parameter \`${wireKey}\` must be at least ${minValue}`)));
   } else if (maxValue !== undefined) {
-    e.cb.line(`if ${valueExpr} > ${pyNum(maxValue)}:`);
+    e.cb.line(cond(`${x} > ${pyNum(maxValue)}`));
     e.cb.indent(() => raise(e, str(`Parameter \`${wireKey}\` must be at most ${maxValue}`)));
   }
 }
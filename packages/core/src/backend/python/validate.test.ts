@@ -1,3 +1,7 @@
+import { execFileSync } from "node:child_process";
+import { mkdtempSync, rmSync, writeFileSync } from "node:fs";
+import { tmpdir } from "node:os";
+import { join } from "node:path";
 import { describe, expect, it } from "vitest";
 import type { Expr } from "../../ir/index.js";
 import { generate, int, float, lit, namedAlt, opt, path, rep, seq, str } from "./test-helpers.js";
@@ -50,7 +54,7 @@ describe("Python validation - wiring", () => {
 
   it("checks the root params is a dict", () => {
     const code = generate(seq(lit("tool"), str("name")));
-    expect(code).toContain("if params is None or not isinstance(params, dict):");
+    expect(code).toContain("if type(params) is not dict and not isinstance(params, dict):");
     expect(code).toContain("Params object has the wrong type");
   });
 });
@@ -58,21 +62,24 @@ describe("Python validation - wiring", () => {
 describe("Python validation - scalar presence and isinstance", () => {
   it("requires non-optional fields and type-checks them", () => {
     const code = generate(seq(lit("tool"), str("name")));
-    expect(code).toContain('if params.get("name", None) is None:');
+    expect(code).toContain('v_name = params.get("name", None)');
+    expect(code).toContain("if v_name is None:");
     expect(code).toContain('raise StyxValidationError("`name` must not be None")');
-    expect(code).toContain('if not isinstance(params["name"], str):');
+    expect(code).toContain("if type(v_name) is not str and not isinstance(v_name, str):");
     expect(code).toContain("expected `str`");
   });
 
   it("type-checks path fields against pathlib.Path/str", () => {
     const code = generate(seq(lit("tool"), path("infile")));
-    expect(code).toContain('if not isinstance(params["infile"], (pathlib.Path, str)):');
+    expect(code).toContain(
+      'if type(v_infile) not in (pathlib.Path, str) and not isinstance(v_infile, (pathlib.Path, str)):',
+    );
     expect(code).toContain("expected `InputPathType`");
   });
 
   it("gates optional fields behind a presence check (no must-not-be-None)", () => {
     const code = generate(seq(lit("tool"), opt(seq(lit("-x"), str("note")))));
-    expect(code).toContain('if params.get("note", None) is not None:');
+    expect(code).toContain("if v_note is not None:");
     expect(code).not.toContain("`note` must not be None");
     expect(code).toContain("expected `str`");
   });
@@ -82,35 +89,37 @@ describe("Python validation - scalar presence and isinstance", () => {
     const code = generate(
       seq(lit("tool"), opt(lit("--loud"), { name: "loud", defaultValue: false })),
     );
-    expect(code).toContain('if params.get("loud", None) is not None:');
+    expect(code).toContain("if v_loud is not None:");
     expect(code).not.toContain("`loud` must not be None");
-    expect(code).toContain('if not isinstance(params["loud"], bool):');
+    expect(code).toContain("if type(v_loud) is not bool and not isinstance(v_loud, bool):");
   });
 });
 
 describe("Python validation - numeric range", () => {
   it("emits a between check when both bounds are set", () => {
     const code = generate(seq(lit("tool"), opt(seq(lit("-n"), intRange("num", 0, 10)))));
-    expect(code).toContain('if not (0 <= params["num"] <= 10):');
+    expect(code).toContain("if not (0 <= v_num <= 10):");
     expect(code).toContain("Parameter `num` must be between 0 and 10 (inclusive)");
   });
 
   it("emits a min-only check", () => {
     const code = generate(seq(lit("tool"), intRange("seed", 1)));
-    expect(code).toContain('if params["seed"] < 1:');
+    expect(code).toContain("if v_seed < 1:");
     expect(code).toContain("Parameter `seed` must be at least 1");
   });
 
   it("emits a max-only check", () => {
     const code = generate(seq(lit("tool"), intRange("cap", undefined, 5)));
-    expect(code).toContain('if params["cap"] > 5:');
+    expect(code).toContain("if v_cap > 5:");
     expect(code).toContain("Parameter `cap` must be at most 5");
   });
 
   it("type-checks float as (float, int) and applies the range", () => {
     const code = generate(seq(lit("tool"), floatRange("ratio", 0, 1)));
-    expect(code).toContain('if not isinstance(params["ratio"], (float, int)):');
-    expect(code).toContain('if not (0 <= params["ratio"] <= 1):');
+    expect(code).toContain(
+      'if type(v_ratio) not in (float, int) and not isinstance(v_ratio, (float, int)):',
+    );
+    expect(code).toContain("if not (0 <= v_ratio <= 1):");
   });
 });
 
@@ -119,11 +128,21 @@ describe("Python validation - list length", () => {
     const code = generate(
       seq(lit("tool"), opt(seq(lit("-r"), listCount(str("items"), "items", 1, 3)))),
     );
-    expect(code).toContain('if not isinstance(params["items"], list):');
-    expect(code).toContain('if not (1 <= len(params["items"]) <= 3):');
+    expect(code).toContain("if type(v_items) is not list and not isinstance(v_items, list):");
+    expect(code).toContain("if not (1 <= len(v_items) <= 3):");
     expect(code).toContain("Parameter `items` must contain between 1 and 3 elements (inclusive)");
-    expect(code).toContain('for e in params["items"]:');
-    expect(code).toContain("if not isinstance(e, str):");
+    expect(code).toContain("if not all(type(e) is str for e in v_items):");
+    expect(code).toContain("for e in v_items:");
+    expect(code).toContain("if type(e) is not str and not isinstance(e, str):");
+  });
+
+  it("range-checks a numeric list per element in one any() pass", () => {
+    const code = generate(seq(lit("tool"), rep(intRange("i", 0, 9), "idx")));
+    expect(code).toContain("if not all(type(e) is int for e in v_idx):");
+    expect(code).toContain("for e in v_idx:");
+    expect(code).toContain("if type(e) is not int and not isinstance(e, int):");
+    expect(code).toContain("if any(not (0 <= e <= 9) for e in v_idx):");
+    expect(code).not.toContain("min(v_idx)");
   });
 
   it("uses singular 'element' for a min of 1", () => {
@@ -141,15 +160,18 @@ describe("Python validation - unions", () => {
         namedAlt("source", seq(lit("--file"), path("file")), seq(lit("--url"), str("url"))),
       ),
     );
-    expect(code).toContain('if not isinstance(params["source"], dict):');
-    expect(code).toContain('if "@type" not in params["source"]:');
+    expect(code).toContain("if type(v_source) is not dict and not isinstance(v_source, dict):");
+    expect(code).toContain('if "@type" not in v_source:');
     expect(code).toContain("Params object is missing `@type`");
-    expect(code).toContain('if params["source"]["@type"] not in ["variant_0", "variant_1"]:');
-    expect(code).toMatch(/if params\["source"\]\["@type"\] == "variant_0":/);
-    expect(code).toMatch(/elif params\["source"\]\["@type"\] == "variant_1":/);
+    expect(code).toContain('t_source = v_source["@type"]');
+    expect(code).toContain('if t_source not in ["variant_0", "variant_1"]:');
+    expect(code).toMatch(/if t_source == "variant_0":/);
+    expect(code).toMatch(/elif t_source == "variant_1":/);
     // recurses into variant struct fields
-    expect(code).toContain('if not isinstance(params["source"]["file"], (pathlib.Path, str)):');
-    expect(code).toContain('if not isinstance(params["source"]["url"], str):');
+    expect(code).toContain(
+      'if type(v_file) not in (pathlib.Path, str) and not isinstance(v_file, (pathlib.Path, str)):',
+    );
+    expect(code).toContain("if type(v_url) is not str and not isinstance(v_url, str):");
   });
 
   it("rejects a duplicate-tagged struct variant (malformed discriminated union)", () => {
@@ -175,7 +197,28 @@ describe("Python validation - unions", () => {
     // the message string escapes the inner double quotes (matches v1 niwrap)
     expect(code).toContain('must be one of [\\"fast\\", \\"slow\\"]');
     // enums are not treated as @type-discriminated dicts
-    expect(code).not.toContain('params["mode"]["@type"]');
+    expect(code).not.toContain('v_mode["@type"]');
+  });
+
+  it("checks a long choice list against a set literal", () => {
+    const choices = ["a", "b", "c", "d", "e"].map((c) => lit(c));
+    const code = generate(seq(lit("tool"), namedAlt("mode", ...choices)));
+    expect(code).toContain('if v_mode not in {"a", "b", "c", "d", "e"}:');
+    // the message keeps the list rendering
+    expect(code).toContain('must be one of [\\"a\\", \\"b\\", \\"c\\", \\"d\\", \\"e\\"]');
+  });
+
+  it("checks a contiguous int choice list as a range", () => {
+    const code = generate(
+      seq(lit("tool"), namedAlt("level", lit("2"), lit("0"), lit("3"), lit("1"))),
+    );
+    expect(code).toContain("if v_level not in range(0, 4):");
+    expect(code).toContain("must be one of [2, 0, 3, 1]");
+  });
+
+  it("keeps a sparse int choice list as a literal", () => {
+    const code = generate(seq(lit("tool"), namedAlt("level", lit("0"), lit("2"), lit("5"))));
+    expect(code).toContain("if v_level not in [0, 2, 5]:");
   });
 
   it("validates a mixed union (struct + bare-literal variants) by runtime shape", () => {
@@ -183,12 +226,109 @@ describe("Python validation - unions", () => {
       seq(lit("tool"), namedAlt("mode", lit("fast"), seq(lit("--full"), str("level")))),
     );
     // dict value -> dispatch struct variants by @type
-    expect(code).toContain('if isinstance(params["mode"], dict):');
-    expect(code).toContain('params["mode"]["@type"] not in ["variant_1"]');
-    expect(code).toContain('if params["mode"]["@type"] == "variant_1":');
-    expect(code).toContain('if not isinstance(params["mode"]["level"], str):');
+    expect(code).toContain("if type(v_mode) is dict or isinstance(v_mode, dict):");
+    expect(code).toContain('t_mode = v_mode["@type"]');
+    expect(code).toContain('if t_mode not in ["variant_1"]:');
+    expect(code).toContain('if t_mode == "variant_1":');
+    expect(code).toContain("if type(v_level) is not str and not isinstance(v_level, str):");
     // bare value -> literal membership
     expect(code).toContain("else:");
-    expect(code).toContain('if params["mode"] not in ["fast"]:');
+    expect(code).toContain('if v_mode not in ["fast"]:');
+  });
+
+  it("never hashes an unchecked @type tag or mixed-union literal", () => {
+    // Neither value is type-checked before the membership test, so a set
+    // literal would raise `TypeError: unhashable type` on a list instead of
+    // failing validation. Both stay lists even past the set threshold.
+    const arms = ["a", "b", "c", "d", "e"].map((n) => seq(lit(`--${n}`), str(n)));
+    const tagged = generate(seq(lit("tool"), namedAlt("source", ...arms)));
+    expect(tagged).toContain(
+      'if t_source not in ["variant_0", "variant_1", "variant_2", "variant_3", "variant_4"]:',
+    );
+    const lits = ["v", "w", "x", "y", "z"].map((c) => lit(c));
+    const mixed = generate(seq(lit("tool"), namedAlt("mode", ...lits, seq(lit("--n"), str("n")))));
+    expect(mixed).toContain('if v_mode not in ["v", "w", "x", "y", "z"]:');
+  });
+});
+
+describe("Python validation - runtime", () => {
+  function findPython(): string | undefined {
+    for (const exe of ["python", "python3"]) {
+      try {
+        execFileSync(exe, ["--version"], { stdio: "ignore" });
+        return exe;
+      } catch {
+        // try next
+      }
+    }
+    return undefined;
+  }
+  const py = findPython();
+  if (!py) {
+    console.warn("Python validation runtime gate skipped: no python interpreter on PATH");
+  }
+
+  // Just enough of `styxdefs` to import a generated module and call its
+  // validator: every other name resolves to an inert placeholder.
+  const STYXDEFS_STUB = [
+    "class StyxValidationError(Exception):",
+    "    pass",
+    "class _Any:",
+    "    def __init__(self, *args, **kwargs):",
+    "        pass",
+    "def __getattr__(name):",
+    "    return _Any",
+    "",
+  ].join("\n");
+
+  /**
+   * Run `tool_validate` on the decoded `paramsJson` (Python's `json` accepts
+   * `NaN`); returns the raised exception's class name, or "ok".
+   */
+  function validateOutcome(code: string, paramsJson: string): string {
+    const dir = mkdtempSync(join(tmpdir(), "styx-validate-"));
+    try {
+      writeFileSync(join(dir, "styxdefs.py"), STYXDEFS_STUB, "utf-8");
+      writeFileSync(join(dir, "tool.py"), code, "utf-8");
+      const script = [
+        "import json, sys",
+        "sys.path.insert(0, sys.argv[1])",
+        "import tool",
+        "try:",
+        "    tool.tool_validate(json.loads(sys.argv[2]))",
+        "    print('ok')",
+        "except Exception as exc:",
+        "    print(type(exc).__name__)",
+      ].join("\n");
+      return execFileSync(py!, ["-c", script, dir, paramsJson], {
+        encoding: "utf-8",
+      }).trim();
+    } finally {
+      rmSync(dir, { recursive: true, force: true });
+    }
+  }
+
+  it.skipIf(!py)("rejects a list-valued @type with StyxValidationError", () => {
+    const arms = ["a", "b", "c", "d", "e"].map((n) => seq(lit(`--${n}`), str(n)));
+    const code = generate(seq(lit("tool"), namedAlt("source", ...arms)), { app: { id: "tool" } });
+    expect(validateOutcome(code, JSON.stringify({ source: { "@type": ["variant_0"] } }))).toBe(
+      "StyxValidationError",
+    );
+  });
+
+  it.skipIf(!py)("rejects a list-valued mixed-union literal with StyxValidationError", () => {
+    const lits = ["v", "w", "x", "y", "z"].map((c) => lit(c));
+    const code = generate(seq(lit("tool"), namedAlt("mode", ...lits, seq(lit("--n"), str("n")))), {
+      app: { id: "tool" },
+    });
+    expect(validateOutcome(code, JSON.stringify({ mode: ["v"] }))).toBe("StyxValidationError");
+  });
+
+  it.skipIf(!py)("rejects a NaN past the first element of a bounded float list", () => {
+    const code = generate(seq(lit("tool"), rep(floatRange("x", 0, 1), "xs")), {
+      app: { id: "tool" },
+    });
+    expect(validateOutcome(code, '{"xs": [0.5, 0.25]}')).toBe("ok");
+    expect(validateOutcome(code, '{"xs": [0.5, NaN]}')).toBe("StyxValidationError");
   });
 });
@@ -59,11 +59,14 @@ export interface SigOptions {
  */
 export function buildSigEntries(
   rootType: Extract<BoundType, { kind: "struct" }>,
-  fieldInfo: Map<string, FieldInfo>,
+  fieldInfo: ReadonlyMap<string, FieldInfo>,
   registerLocal: (wireKey: string) => string,
   opts: SigOptions,
 ): SigEntry[] {
-  const entries: SigEntry[] = [];
+  // Partitioned as they are built, so the required-first order needs no sort
+  // or filter passes afterwards.
+  const required: SigEntry[] = [];
+  const defaulted: SigEntry[] = [];
   for (const [fieldName, fieldType] of Object.entries(rootType.fields)) {
     if (fieldType.kind === "literal") continue;
 
@@ -81,7 +84,7 @@ export function buildSigEntries(
       sigDefault = opts.nullableDefault;
     }
 
-    entries.push({
+    (sigDefault === undefined ? required : defaulted).push({
       name: registerLocal(fieldName),
       wireKey: fieldName,
       sigType,
@@ -91,7 +94,5 @@ export function buildSigEntries(
       doc: fi?.doc,
     });
   }
-  const required = entries.filter((e) => e.sigDefault === undefined);
-  const defaulted = entries.filter((e) => e.sigDefault !== undefined);
-  return [...required, ...defaulted];
+  return required.concat(defaulted);
 }
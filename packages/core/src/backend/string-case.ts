@@ -1,14 +1,20 @@
-/** Split a string into lowercase word tokens for case conversion. */
-function tokenize(s: string): string[] {
-  return s
+import { boundedMemo } from "./memo.js";
+
+/**
+ * Split a string into lowercase word tokens for case conversion. The same
+ * field, struct and tool names are re-cased many times over a build, so the
+ * regex tokenization is memoized per input.
+ */
+const tokenize = boundedMemo((s: string): readonly string[] =>
+  s
     .replace(/([a-z0-9])([A-Z])/g, "$1 $2") // camelCase boundary
     .replace(/([A-Z]+)([A-Z][a-z])/g, "$1 $2") // consecutive uppercase -> keep runs
     .replace(/[^a-zA-Z0-9]+/g, " ")
     .trim()
     .toLowerCase()
     .split(/\s+/)
-    .filter(Boolean);
-}
+    .filter(Boolean),
+);
 
 export function snakeCase(s: string): string {
   return tokenize(s).join("_");
@@ -37,16 +37,35 @@ export function typeKey(type: BoundType): string {
   }
 }
 
+/**
+ * Keys of already-visited structs/unions, by object identity. Backends ask for
+ * the same aggregate's key many times over (type collection, name resolution
+ * per field, declaration ordering), and each key stringifies the whole subtree,
+ * so recomputing it makes nested declarations quadratic. BoundTypes are not
+ * mutated once the solver returns, so a key never goes stale.
+ */
+const keyCache = new WeakMap<BoundType, string>();
+
 /** Stable identity key for a struct type (field names + field types). */
 export function structKey(type: Extract<BoundType, { kind: "struct" }>): string {
-  const fields = Object.entries(type.fields)
-    .map(([name, fieldType]) => `${name}=${typeKey(fieldType)}`)
-    .join(",");
-  return `struct{${fields}}`;
+  let key = keyCache.get(type);
+  if (key === undefined) {
+    const fields = Object.entries(type.fields)
+      .map(([name, fieldType]) => `${name}=${typeKey(fieldType)}`)
+      .join(",");
+    key = `struct{${fields}}`;
+    keyCache.set(type, key);
+  }
+  return key;
 }
 
 /** Stable identity key for a union type (variant names + variant types). */
 export function unionKey(type: Extract<BoundType, { kind: "union" }>): string {
-  const variants = type.variants.map((v) => `${v.name ?? "?"}=${typeKey(v.type)}`).join("|");
-  return `union[${variants}]`;
+  let key = keyCache.get(type);
+  if (key === undefined) {
+    const variants = type.variants.map((v) => `${v.name ?? "?"}=${typeKey(v.type)}`).join("|");
+    key = `union[${variants}]`;
+    keyCache.set(type, key);
+  }
+  return key;
 }
@@ -5,7 +5,13 @@ import { collectFieldInfo } from "./collect-field-info.js";
 import type { OutputField, StreamField } from "./collect-output-fields.js";
 import { collectOutputFields, streamFields } from "./collect-output-fields.js";
 import { appModuleName, buildEmitModel, pyId } from "./python/index.js";
-import { findNode, findRangeNode, findRepeatNode, structFields } from "./validate-walk.js";
+import {
+  findAlternativeNode,
+  findNodeOfKind,
+  findRangeNode,
+  findRepeatNode,
+  structFields,
+} from "./validate-walk.js";
 
 /**
  * A flat, rich projection of a tool's solved tree, for Python-ecosystem
@@ -222,8 +228,8 @@ function literalChoices(inner: BoundType, node: Expr | undefined): (string | num
   }
   // Fallback: an IR alternative of literal nodes the solver did not surface as a
   // union of BoundType literals.
-  const altNode = node ? findNode(node, (n) => n.kind === "alternative") : undefined;
-  if (altNode && altNode.kind === "alternative") {
+  const altNode = findAlternativeNode(node);
+  if (altNode) {
     const alts = altNode.attrs.alts;
     if (alts.length > 0 && alts.every((a) => a.kind === "literal")) {
       return alts.map((a) => (a as Extract<Expr, { kind: "literal" }>).attrs.str);
@@ -249,7 +255,7 @@ function listBounds(node: Expr | undefined): { min?: number; max?: number } | un
 }
 
 function pathMediaTypes(node: Expr | undefined): string[] | undefined {
-  const p = node ? findNode(node, (n) => n.kind === "path") : undefined;
+  const p = findNodeOfKind(node, "path");
   if (p && p.kind === "path") {
     const mt = p.attrs.mediaTypes;
     if (mt && mt.length > 0) return mt;
@@ -200,25 +200,19 @@ function walkOptional(
   // context needs threading - only the existing loop scope and join depth.
   const inner = walk(node.attrs.node, ctx, arg);
 
+  // A nullable optional is set iff its value is non-null; a bool flag iff it
+  // is truthy. Decide the guard once and share it between both emit forms.
+  const guard = binding.type.kind === "optional" ? `${access} != null` : access;
+
   // Inside a join context, emit as ternary expression
   if (arg.joinDepth > 0 && isExpr(inner)) {
-    if (binding.type.kind === "optional") {
-      return { expr: `(${access} != null ? ${inner.expr} : "")` };
-    }
-    return { expr: `(${access} ? ${inner.expr} : "")` };
+    return { expr: `(${guard} ? ${inner.expr} : "")` };
   }
 
   const cb = new CodeBuilder("  ");
-  const innerStmt = resultToStmt(inner);
-  if (binding.type.kind === "optional") {
-    cb.line(`if (${access} != null) {`);
-    cb.indent(() => appendLines(cb, innerStmt));
-    cb.line("}");
-  } else {
-    cb.line(`if (${access}) {`);
-    cb.indent(() => appendLines(cb, innerStmt));
-    cb.line("}");
-  }
+  cb.line(`if (${guard}) {`);
+  cb.indent(() => appendLines(cb, resultToStmt(inner)));
+  cb.line("}");
   return { stmt: cb.toString() };
 }
 
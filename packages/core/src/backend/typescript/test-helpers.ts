@@ -47,17 +47,33 @@ interface RunResult {
   outputs: unknown;
 }
 
+/**
+ * Transpiled CommonJS per generated source. Tests commonly drive one generated
+ * module with several param sets, and transpiling dominates each run, so a
+ * source is only transpiled the first time it is seen.
+ */
+const transpileCache = new Map<string, string>();
+
+function transpile(tsCode: string): string {
+  let jsCode = transpileCache.get(tsCode);
+  if (jsCode === undefined) {
+    jsCode = ts.transpileModule(tsCode, {
+      compilerOptions: {
+        module: ts.ModuleKind.CommonJS,
+        target: ts.ScriptTarget.ES2022,
+      },
+    }).outputText;
+    transpileCache.set(tsCode, jsCode);
+  }
+  return jsCode;
+}
+
 function runGenerated(
   tsCode: string,
   params: Record<string, unknown>,
   wrapperExport: string,
 ): RunResult {
-  const jsCode = ts.transpileModule(tsCode, {
-    compilerOptions: {
-      module: ts.ModuleKind.CommonJS,
-      target: ts.ScriptTarget.ES2022,
-    },
-  }).outputText;
+  const jsCode = transpile(tsCode);
 
   let capturedArgs: string[] = [];
   const mockExecution = {
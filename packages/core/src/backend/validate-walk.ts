@@ -3,6 +3,7 @@ import type { Expr, Float, Int, Repeat } from "../ir/index.js";
 import type { CodegenContext } from "../manifest/index.js";
 import { collectFieldInfo } from "./collect-field-info.js";
 import { findStructNode } from "./find-struct-node.js";
+import { memoPerContext } from "./memo.js";
 import { resolveFieldBinding } from "./resolve-field-binding.js";
 
 /**
@@ -30,15 +31,29 @@ export interface FieldEntry {
   hasDefault: boolean;
 }
 
+type StructType = Extract<BoundType, { kind: "struct" }>;
+
 /**
  * Enumerate a struct type's fields in declaration order, each paired with the
  * IR node its binding resolved from. `searchRoot` is the IR subtree known to
  * contain the struct (the root expr for the top-level struct, or a field /
- * union-arm node for nested ones).
+ * union-arm node for nested ones). Every backend's validator (and the typed
+ * spec) asks for the same struct, so the result is memoized per context and
+ * search root (`memoPerContext`).
  */
 export function structFields(
   ctx: CodegenContext,
-  structType: Extract<BoundType, { kind: "struct" }>,
+  structType: StructType,
+  searchRoot: Expr | undefined,
+): readonly FieldEntry[] {
+  return memoPerContext(ctx, [structFields, structType, searchRoot], () =>
+    computeStructFields(ctx, structType, searchRoot),
+  );
+}
+
+function computeStructFields(
+  ctx: CodegenContext,
+  structType: StructType,
   searchRoot: Expr | undefined,
 ): FieldEntry[] {
   const nodeByName = new Map<string, Expr>();
@@ -61,51 +76,52 @@ export function structFields(
 }
 
 /**
- * Depth-first search for the first node satisfying `pred`, descending through
- * the transparent structural wrappers the solver may bury a binding under
- * (sequence/optional/repeat/alternative).
+ * Depth-first search for the first node of `kind` (or `altKind`), descending
+ * through the transparent structural wrappers the solver may bury a binding
+ * under (sequence/optional/repeat/alternative). The constraint lookups below
+ * run per field during emit, so the kind is compared inline rather than via a
+ * predicate callback.
  */
-export function findNode(node: Expr | undefined, pred: (n: Expr) => boolean): Expr | undefined {
-  if (!node) return undefined;
-  if (pred(node)) return node;
-  switch (node.kind) {
-    case "sequence":
-      for (const child of node.attrs.nodes) {
-        const r = findNode(child, pred);
-        if (r) return r;
-      }
-      return undefined;
-    case "optional":
-      return findNode(node.attrs.node, pred);
-    case "repeat":
-      return findNode(node.attrs.node, pred);
-    case "alternative":
-      for (const alt of node.attrs.alts) {
-        const r = findNode(alt, pred);
-        if (r) return r;
+export function findNodeOfKind(
+  node: Expr | undefined,
+  kind: Expr["kind"],
+  altKind?: Expr["kind"],
+): Expr | undefined {
+  // Explicit stack, children pushed in reverse so they pop in source order:
+  // the first match is the same one a recursive pre-order walk would find.
+  const stack: Expr[] = node ? [node] : [];
+  let current: Expr | undefined;
+  while ((current = stack.pop()) !== undefined) {
+    if (current.kind === kind || current.kind === altKind) return current;
+    switch (current.kind) {
+      case "sequence":
+      case "alternative": {
+        const children = current.kind === "sequence" ? current.attrs.nodes : current.attrs.alts;
+        for (let i = children.length - 1; i >= 0; i--) stack.push(children[i]!);
+        break;
       }
-      return undefined;
-    default:
-      return undefined;
+      case "optional":
+      case "repeat":
+        stack.push(current.attrs.node);
+        break;
+    }
   }
+  return undefined;
 }
 
 /** Locate the int/float node carrying a scalar field's numeric range. */
 export function findRangeNode(node: Expr | undefined): Int | Float | undefined {
-  const found = findNode(node, (n) => n.kind === "int" || n.kind === "float");
-  return found as Int | Float | undefined;
+  return findNodeOfKind(node, "int", "float") as Int | Float | undefined;
 }
 
 /** Locate the repeat node carrying a list field's length bounds and item. */
 export function findRepeatNode(node: Expr | undefined): Repeat | undefined {
-  const found = findNode(node, (n) => n.kind === "repeat");
-  return found as Repeat | undefined;
+  return findNodeOfKind(node, "repeat") as Repeat | undefined;
 }
 
 /** Locate the alternative node backing a union field, to map arms to variants. */
 export function findAlternativeNode(
   node: Expr | undefined,
 ): Extract<Expr, { kind: "alternative" }> | undefined {
-  const found = findNode(node, (n) => n.kind === "alternative");
-  return found as Extract<Expr, { kind: "alternative" }> | undefined;
+  return findNodeOfKind(node, "alternative") as Extract<Expr, { kind: "alternative" }> | undefined;
 }
@@ -1,6 +1,6 @@
 import { describe, expect, it } from "vitest";
 import type { Output } from "../../ir/index.js";
-import type { Alternative, Expr, Optional, Repeat, Sequence } from "../../ir/node.js";
+import type { Alternative, Expr, Literal, Optional, Repeat, Sequence } from "../../ir/node.js";
 import { BoutiquesParser } from "./parser.js";
 
 const parser = new BoutiquesParser();
@@ -569,6 +569,18 @@ describe("BoutiquesParser", () => {
       const alt = (result.expr as Sequence).attrs.nodes[1] as Alternative;
       expect(alt.attrs.alts).toHaveLength(2);
     });
+
+    it("drops duplicate enum choices with a warning", () => {
+      const result = parse(
+        minimalDescriptor({
+          "command-line": "test [INPUT1]",
+          inputs: [minimalInput({ type: "String", "value-choices": ["a", "b", "a"] })],
+        }),
+      );
+      expect(result.warnings.some((w) => w.message.includes("duplicate enum choice"))).toBe(true);
+      const alt = (result.expr as Sequence).attrs.nodes[1] as Alternative;
+      expect(alt.attrs.alts.map((a) => (a as Literal).attrs.str)).toEqual(["a", "b"]);
+    });
   });
 
   describe("node metadata", () => {
@@ -41,6 +41,20 @@ function isArray(x: unknown): x is unknown[] {
   return Array.isArray(x);
 }
 
+/**
+ * Build a `{ title, description }` doc from raw descriptor fields, setting only
+ * the fields that are strings; `undefined` when neither is. Assigns directly
+ * instead of spreading a temporary object per field, since this runs for
+ * every input, output and stream of every descriptor.
+ */
+function titledDoc(title: unknown, description: unknown): Documentation | undefined {
+  if (!isString(title) && !isString(description)) return undefined;
+  const doc: Documentation = {};
+  if (isString(title)) doc.title = title;
+  if (isString(description)) doc.description = description;
+  return doc;
+}
+
 // Outputs attach to the rootSeq of the descriptor they were declared in
 // (root or a subcommand's sequence). Per-ref gating is computed downstream
 // from each referenced binding's `gate`.
@@ -173,16 +187,12 @@ export class BoutiquesParser implements Frontend {
       return undefined;
     }
 
-    return {
-      ...(isString(name) && { name }),
-      ...((isString(title) || isString(description)) && {
-        doc: {
-          ...(isString(title) && { title }),
-          ...(isString(description) && { description }),
-        },
-      }),
-      ...(hasDefault && { defaultValue }),
-    };
+    const meta: NodeMeta = {};
+    if (isString(name)) meta.name = name;
+    const doc = titledDoc(title, description);
+    if (doc) meta.doc = doc;
+    if (hasDefault) meta.defaultValue = defaultValue;
+    return meta;
   }
 
   private buildStreamMeta(
@@ -194,15 +204,8 @@ export class BoutiquesParser implements Frontend {
     const name = bt.name;
     const description = bt.description;
 
-    return {
-      name: id,
-      ...((isString(name) || isString(description)) && {
-        doc: {
-          ...(isString(name) && { title: name }),
-          ...(isString(description) && { description }),
-        },
-      }),
-    };
+    const doc = titledDoc(name, description);
+    return doc ? { name: id, doc } : { name: id };
   }
 
   private buildOutput(
@@ -241,15 +244,9 @@ export class BoutiquesParser implements Frontend {
       };
     });
 
-    const title = out.name;
-    const description = out.description;
     const output: Output = { name: id, tokens };
-    if (isString(title) || isString(description)) {
-      output.doc = {
-        ...(isString(title) && { title }),
-        ...(isString(description) && { description }),
-      };
-    }
+    const doc = titledDoc(out.name, out.description);
+    if (doc) output.doc = doc;
     // Boutiques' `optional: bool` on output-files is a tool-author hint and is
     // re-derived at emit time from the refs' bindings - we don't store it.
 
@@ -332,15 +329,22 @@ export class BoutiquesParser implements Frontend {
 
   private buildEnumAlternative(choices: unknown[], meta?: NodeMeta): Alternative | null {
     const alts: Literal[] = [];
+    // Choices are compared by their rendered string, so `1` and `"1"` collide
+    // too: both would emit the same literal arm (and a duplicate union member).
+    const seen = new Set<string>();
 
     for (const choice of choices) {
-      if (isString(choice)) {
-        alts.push({ kind: "literal", attrs: { str: choice } });
-      } else if (isNumber(choice)) {
-        alts.push({ kind: "literal", attrs: { str: String(choice) } });
-      } else {
+      if (!isString(choice) && !isNumber(choice)) {
         this.warn(`Ignoring non-string/number enum choice: ${JSON.stringify(choice)}`);
+        continue;
+      }
+      const str = String(choice);
+      if (seen.has(str)) {
+        this.warn(`Ignoring duplicate enum choice: ${JSON.stringify(choice)}`);
+        continue;
       }
+      seen.add(str);
+      alts.push({ kind: "literal", attrs: { str } });
     }
 
     if (alts.length === 0) return null;
@@ -1,3 +1,10 @@
+// Characters a backslash escapes inside double quotes (POSIX shell rules).
+const DOUBLE_QUOTE_ESCAPES = new Set(["\\", '"', "$", "`", "\n"]);
+const WHITESPACE = /\s/;
+const WHITESPACE_RUN = /\s+/;
+// Any character that needs the quote/escape state machine below.
+const QUOTE_OR_ESCAPE = /['"\\]/;
+
 /**
  * Split a Boutiques command into a list of arguments.
  *
@@ -10,6 +17,12 @@ export function boutiquesSplitCommand(command: string): string[] {
     throw new Error("Command cannot be null or undefined");
   }
 
+  // Most command-line templates are plain space-separated tokens: split those
+  // directly and keep the per-character state machine for quoted/escaped input.
+  if (!QUOTE_OR_ESCAPE.test(command)) {
+    return command.split(WHITESPACE_RUN).filter((arg) => arg !== "");
+  }
+
   const args: string[] = [];
   let current = "";
   let inSingleQuote = false;
@@ -19,7 +32,7 @@ export function boutiquesSplitCommand(command: string): string[] {
   for (const char of command) {
     if (escaped) {
       // In double quotes, only certain escapes are meaningful
-      if (inDoubleQuote && !["\\", '"', "$", "`", "\n"].includes(char)) {
+      if (inDoubleQuote && !DOUBLE_QUOTE_ESCAPES.has(char)) {
         current += "\\";
       }
       current += char;
@@ -42,7 +55,7 @@ export function boutiquesSplitCommand(command: string): string[] {
       continue;
     }
 
-    if (/\s/.test(char) && !inSingleQuote && !inDoubleQuote) {
+    if (WHITESPACE.test(char) && !inSingleQuote && !inDoubleQuote) {
       if (current) {
         args.push(current);
         current = "";
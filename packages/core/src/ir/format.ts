@@ -24,7 +24,7 @@ export function format(expr: Expr, meta?: AppMeta): string {
     lines.push("");
   }
 
-  lines.push(formatExpr(expr, 0));
+  formatExpr(expr, 0, lines);
   return lines.join("\n");
 }
 
@@ -38,120 +38,93 @@ function formatOutputToken(token: OutputToken): string {
   return `ref(${token.target.name})${suffix}`;
 }
 
-function formatOutputsBlock(outputs: Output[], indent: number): string {
+function formatOutputsBlock(outputs: Output[], indent: number, lines: string[]): void {
   const pad = "  ".repeat(indent);
-  const lines = [`${pad}outputs:`];
+  lines.push(`${pad}outputs:`);
   for (const out of outputs) {
     const name = out.name ?? "<anon>";
     const media = out.mediaTypes?.length ? ` (${out.mediaTypes.join(", ")})` : "";
     const tokens = out.tokens.map(formatOutputToken).join(" + ") || `""`;
     lines.push(`${pad}  ${name}${media}: ${tokens}`);
   }
-  return lines.join("\n");
 }
 
-// Splice the outputs block in right after the node's header line (its first
-// line), before any child lines, so outputs read naturally as belonging to
-// the node they decorate.
-function spliceOutputs(body: string, outputsBlock: string): string {
-  if (!outputsBlock) return body;
-  const nl = body.indexOf("\n");
-  if (nl === -1) return `${body}\n${outputsBlock}`;
-  return `${body.slice(0, nl)}\n${outputsBlock}${body.slice(nl)}`;
+/** Push a node's header line, then its outputs block (if any). */
+function pushHeader(expr: Expr, indent: number, text: string, lines: string[]): void {
+  lines.push(text);
+  if (expr.meta?.outputs?.length) formatOutputsBlock(expr.meta.outputs, indent + 1, lines);
 }
 
-function formatExpr(expr: Expr, indent: number): string {
+// Nodes append their lines to one shared buffer (joined once by `format`)
+// rather than each level joining its children's strings and the parent
+// re-joining them. The outputs block goes right after the node's header line,
+// before any child lines, so outputs read naturally as belonging to the node
+// they decorate.
+function formatExpr(expr: Expr, indent: number, lines: string[]): void {
   const pad = "  ".repeat(indent);
   const name = expr.meta?.name ? ` [${expr.meta.name}]` : "";
-  const outputsBlock = expr.meta?.outputs?.length
-    ? formatOutputsBlock(expr.meta.outputs, indent + 1)
-    : "";
 
-  let body: string;
   switch (expr.kind) {
     case "literal":
-      body = `${pad}literal${name} "${expr.attrs.str}"`;
-      break;
+      pushHeader(expr, indent, `${pad}literal${name} "${expr.attrs.str}"`, lines);
+      return;
 
     case "str":
-      body = `${pad}str${name}`;
-      break;
-
-    case "int": {
-      const { minValue, maxValue } = expr.attrs;
-      const range =
-        minValue !== undefined || maxValue !== undefined
-          ? ` (${minValue ?? ""}..${maxValue ?? ""})`
-          : "";
-      body = `${pad}int${name}${range}`;
-      break;
-    }
+      pushHeader(expr, indent, `${pad}str${name}`, lines);
+      return;
 
+    case "int":
     case "float": {
       const { minValue, maxValue } = expr.attrs;
       const range =
         minValue !== undefined || maxValue !== undefined
           ? ` (${minValue ?? ""}..${maxValue ?? ""})`
           : "";
-      body = `${pad}float${name}${range}`;
-      break;
+      pushHeader(expr, indent, `${pad}${expr.kind}${name}${range}`, lines);
+      return;
     }
 
     case "path": {
-      const flags = [
-        expr.attrs.resolveParent && "resolveParent",
-        expr.attrs.mutable && "mutable",
-      ].filter(Boolean);
-      const suffix = flags.length > 0 ? ` {${flags.join(", ")}}` : "";
-      body = `${pad}path${name}${suffix}`;
-      break;
+      let flags = expr.attrs.resolveParent ? "resolveParent" : "";
+      if (expr.attrs.mutable) flags += `${flags ? ", " : ""}mutable`;
+      pushHeader(expr, indent, `${pad}path${name}${flags ? ` {${flags}}` : ""}`, lines);
+      return;
     }
 
     case "sequence": {
       const join = expr.attrs.join !== undefined ? ` join="${expr.attrs.join}"` : "";
-      const header = `${pad}sequence${name}${join}`;
       if (expr.attrs.nodes.length === 0) {
-        body = `${header} (empty)`;
-      } else {
-        const children = expr.attrs.nodes.map((n) => formatExpr(n, indent + 1)).join("\n");
-        body = `${header}\n${children}`;
+        pushHeader(expr, indent, `${pad}sequence${name}${join} (empty)`, lines);
+        return;
       }
-      break;
+      pushHeader(expr, indent, `${pad}sequence${name}${join}`, lines);
+      for (const n of expr.attrs.nodes) formatExpr(n, indent + 1, lines);
+      return;
     }
 
-    case "alternative": {
-      const header = `${pad}alternative${name}`;
-      const children = expr.attrs.alts.map((n) => formatExpr(n, indent + 1)).join("\n");
-      body = `${header}\n${children}`;
-      break;
-    }
+    case "alternative":
+      pushHeader(expr, indent, `${pad}alternative${name}`, lines);
+      for (const n of expr.attrs.alts) formatExpr(n, indent + 1, lines);
+      return;
 
-    case "optional": {
-      const header = `${pad}optional${name}`;
-      const child = formatExpr(expr.attrs.node, indent + 1);
-      body = `${header}\n${child}`;
-      break;
-    }
+    case "optional":
+      pushHeader(expr, indent, `${pad}optional${name}`, lines);
+      formatExpr(expr.attrs.node, indent + 1, lines);
+      return;
 
     case "repeat": {
       const { join, countMin, countMax } = expr.attrs;
-      const parts = [
-        join !== undefined && `join="${join}"`,
-        countMin !== undefined && `min=${countMin}`,
-        countMax !== undefined && `max=${countMax}`,
-      ].filter(Boolean);
-      const suffix = parts.length > 0 ? ` {${parts.join(", ")}}` : "";
-      const header = `${pad}repeat${name}${suffix}`;
-      const child = formatExpr(expr.attrs.node, indent + 1);
-      body = `${header}\n${child}`;
-      break;
+      let parts = join !== undefined ? `join="${join}"` : "";
+      if (countMin !== undefined) parts += `${parts ? ", " : ""}min=${countMin}`;
+      if (countMax !== undefined) parts += `${parts ? ", " : ""}max=${countMax}`;
+      pushHeader(expr, indent, `${pad}repeat${name}${parts ? ` {${parts}}` : ""}`, lines);
+      formatExpr(expr.attrs.node, indent + 1, lines);
+      return;
     }
 
     default: {
       const _exhaustive: never = expr;
-      body = `${pad}unknown`;
+      pushHeader(expr, indent, `${pad}unknown`, lines);
     }
   }
-
-  return spliceOutputs(body, outputsBlock);
 }
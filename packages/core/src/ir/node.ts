@@ -86,10 +86,26 @@ export type Expr = StructuralNode | Terminal;
 
 // Type guards
 
+// Built once: the guards run per node in pass and backend walks, so they look
+// the kind up in a shared set instead of allocating and scanning an array.
+const TERMINAL_KINDS: ReadonlySet<Expr["kind"]> = new Set<Terminal["kind"]>([
+  "literal",
+  "int",
+  "float",
+  "str",
+  "path",
+]);
+const STRUCTURAL_KINDS: ReadonlySet<Expr["kind"]> = new Set<StructuralNode["kind"]>([
+  "sequence",
+  "optional",
+  "alternative",
+  "repeat",
+]);
+
 export function isTerminal(expr: Expr): expr is Terminal {
-  return ["literal", "int", "float", "str", "path"].includes(expr.kind);
+  return TERMINAL_KINDS.has(expr.kind);
 }
 
 export function isStructural(expr: Expr): expr is StructuralNode {
-  return ["sequence", "optional", "alternative", "repeat"].includes(expr.kind);
+  return STRUCTURAL_KINDS.has(expr.kind);
 }
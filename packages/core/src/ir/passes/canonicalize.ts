@@ -5,13 +5,29 @@ import { PassStatus, type Pass, type PassResult } from "./pass.js";
  * Canonicalize IR for consistent representation:
  * - Sort alternatives by kind, then name, then structure
  * - Deduplicate identical alternatives
+ *
+ * Not part of `defaultPipeline` (it is commented out there); it only runs for
+ * callers that pass it to `createPipeline` or apply it directly.
  */
 export const canonicalize: Pass = {
   name: "canonicalize",
   apply(expr: Expr): PassResult {
     let changed = false;
+    // Hashes are built bottom-up and every enclosing alternative re-hashes its
+    // arms' subtrees (sort key, then identity key), so each node's hash is
+    // computed once per run and reused.
+    const hashes = new Map<Expr, string>();
 
     function structuralHash(node: Expr): string {
+      let hash = hashes.get(node);
+      if (hash === undefined) {
+        hash = computeHash(node);
+        hashes.set(node, hash);
+      }
+      return hash;
+    }
+
+    function computeHash(node: Expr): string {
       switch (node.kind) {
         case "literal":
           return `lit:${node.attrs.str}`;
@@ -61,8 +77,9 @@ export const canonicalize: Pass = {
         case "alternative": {
           const children = node.attrs.alts.map(visit);
 
-          // Sort alternatives
-          const sorted = [...children].sort((a, b) => sortKey(a).localeCompare(sortKey(b)));
+          // Sort alternatives (keys built once per arm, not per comparison)
+          const keys = new Map(children.map((child) => [child, sortKey(child)]));
+          const sorted = [...children].sort((a, b) => keys.get(a)!.localeCompare(keys.get(b)!));
 
           // Deduplicate identical arms (structure + discriminating meta).
           const seen = new Set<string>();
@@ -77,11 +94,10 @@ export const canonicalize: Pass = {
             }
           }
 
-          // Check if order changed
-          if (
-            alts.length !== children.length ||
-            alts.some((alt, i) => identityKey(alt) !== identityKey(children[i]!))
-          ) {
+          // Check if order changed. Without a dropped duplicate `alts` is a
+          // permutation of `children`, so comparing by reference finds a move
+          // (stopping at the first one) without rebuilding any keys.
+          if (!changed && alts.some((alt, i) => alt !== children[i])) {
             changed = true;
           }
 
@@ -1,5 +1,5 @@
 import type { NodeMeta, Output } from "../meta.js";
-import type { Expr } from "../node.js";
+import type { Expr, Sequence } from "../node.js";
 import { PassStatus, type Pass, type PassResult } from "./pass.js";
 
 /**
@@ -28,22 +28,29 @@ function isInlinable(meta: NodeMeta | undefined): boolean {
   );
 }
 
-/** Add every `meta.name` bound anywhere in a subtree to `acc`. */
-function collectNames(node: Expr, acc: (name: string) => void): void {
-  if (node.meta?.name !== undefined) acc(node.meta.name);
-  switch (node.kind) {
-    case "sequence":
-      for (const child of node.attrs.nodes) collectNames(child, acc);
-      return;
-    case "alternative":
-      for (const child of node.attrs.alts) collectNames(child, acc);
-      return;
-    case "optional":
-    case "repeat":
-      collectNames(node.attrs.node, acc);
-      return;
-    default:
-      return;
+/**
+ * Add every `meta.name` bound anywhere in a subtree to `acc`. Walks an explicit
+ * stack rather than recursing (the caller only counts names, so visit
+ * order is irrelevant), which keeps deeply nested descriptors off the call
+ * stack.
+ */
+function collectNames(root: Expr, acc: (name: string) => void): void {
+  const stack: Expr[] = [root];
+  let node: Expr | undefined;
+  while ((node = stack.pop()) !== undefined) {
+    if (node.meta?.name !== undefined) acc(node.meta.name);
+    switch (node.kind) {
+      case "sequence":
+        stack.push(...node.attrs.nodes);
+        break;
+      case "alternative":
+        stack.push(...node.attrs.alts);
+        break;
+      case "optional":
+      case "repeat":
+        stack.push(node.attrs.node);
+        break;
+    }
   }
 }
 
@@ -58,11 +65,49 @@ function duplicatedNames(root: Expr): Set<string> {
   return duplicated;
 }
 
-/** The names bound in a subtree. */
-function namesIn(node: Expr): Set<string> {
-  const names = new Set<string>();
-  collectNames(node, (name) => names.add(name));
-  return names;
+/**
+ * The names bound in a subtree, memoized in `cache` for the run. Flatten asks
+ * for each child's names at every sequence level, so without the cache an
+ * enclosing sequence re-walks subtrees its children already answered for. Built
+ * bottom-up from the children's (shared, never mutated) sets, in a post-order
+ * walk over an explicit stack like `collectNames`.
+ */
+function namesIn(root: Expr, cache: Map<Expr, ReadonlySet<string>>): ReadonlySet<string> {
+  // Each node is pushed twice: first to queue its uncached children, then (once
+  // they are all cached) to union their sets.
+  const stack: [Expr, boolean][] = [[root, false]];
+  let top: [Expr, boolean] | undefined;
+  while ((top = stack.pop()) !== undefined) {
+    const [node, childrenDone] = top;
+    if (cache.has(node)) continue;
+    let children: readonly Expr[] = [];
+    switch (node.kind) {
+      case "sequence":
+        children = node.attrs.nodes;
+        break;
+      case "alternative":
+        children = node.attrs.alts;
+        break;
+      case "optional":
+      case "repeat":
+        children = [node.attrs.node];
+        break;
+    }
+    if (!childrenDone) {
+      stack.push([node, true]);
+      for (const child of children) {
+        if (!cache.has(child)) stack.push([child, false]);
+      }
+      continue;
+    }
+    const names = new Set<string>();
+    if (node.meta?.name !== undefined) names.add(node.meta.name);
+    for (const child of children) {
+      for (const name of cache.get(child)!) names.add(name);
+    }
+    cache.set(node, names);
+  }
+  return cache.get(root)!;
 }
 
 /**
@@ -75,12 +120,32 @@ export const flatten: Pass = {
   apply(expr: Expr): PassResult {
     let changed = false;
     const ambiguous = duplicatedNames(expr);
+    const namesCache = new Map<Expr, ReadonlySet<string>>();
 
     function visit(node: Expr): Expr {
       switch (node.kind) {
         case "sequence": {
           const children = node.attrs.nodes.map(visit);
-          const names = children.map(namesIn);
+          const join = node.attrs.join;
+          const isCandidate = (child: Expr): child is Sequence =>
+            child.kind === "sequence" && child.attrs.join === join && isInlinable(child.meta);
+          // Most sequences have no inlinable child; skip the name analysis below
+          // (a walk of every child's subtree) when there is nothing to merge.
+          if (!children.some(isCandidate)) {
+            return { ...node, attrs: { ...node.attrs, nodes: children } };
+          }
+
+          const names = children.map((child) => namesIn(child, namesCache));
+          // How many children bind each name. A name is bound outside child `i`
+          // exactly when more children bind it than `i` itself accounts for, so
+          // one count per sequence replaces rebuilding the union of every other
+          // child's names for each candidate.
+          const bindCount = new Map<string, number>();
+          for (const n of names) {
+            for (const name of n) bindCount.set(name, (bindCount.get(name) ?? 0) + 1);
+          }
+          const boundOutside = (index: number, name: string): boolean =>
+            (bindCount.get(name) ?? 0) > (names[index]!.has(name) ? 1 : 0);
           const nodes: Expr[] = [];
           const hoisted: Output[] = [];
 
@@ -103,19 +168,15 @@ export const flatten: Pass = {
             if (outputs.length > 0 && child.kind === "sequence" && child.attrs.nodes.length === 0) {
               return false;
             }
-            const outside = new Set<string>();
-            names.forEach((n, i) => {
-              if (i !== index) for (const name of n) outside.add(name);
-            });
             // A name bound on both sides of the merge would collide.
-            for (const name of names[index]!) if (outside.has(name)) return false;
+            for (const name of names[index]!) if (boundOutside(index, name)) return false;
             // A hoisted output's ref resolves against the scope's subtree, which
             // the move widens to the parent's. That only changes which binding
             // it finds if the name is ambiguous - a name bound exactly once in
             // the tree resolves to the same node either way.
             for (const output of outputs) {
               for (const token of output.tokens) {
-                if (token.kind === "ref" && outside.has(token.target.name)) {
+                if (token.kind === "ref" && boundOutside(index, token.target.name)) {
                   if (ambiguous.has(token.target.name)) return false;
                 }
               }
@@ -124,12 +185,7 @@ export const flatten: Pass = {
           };
 
           for (const [index, child] of children.entries()) {
-            if (
-              child.kind === "sequence" &&
-              child.attrs.join === node.attrs.join &&
-              isInlinable(child.meta) &&
-              isSafeToMerge(child, index)
-            ) {
+            if (isCandidate(child) && isSafeToMerge(child, index)) {
               changed = true;
               nodes.push(...child.attrs.nodes);
               // The inlined child was the scope its outputs belonged to; this
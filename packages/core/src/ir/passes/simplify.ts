@@ -1,7 +1,54 @@
 import type { NodeMeta } from "../meta.js";
-import type { Expr } from "../node.js";
+import type { Expr, Literal } from "../node.js";
+import type { Documentation } from "../types.js";
 import { PassStatus, type Pass, type PassResult } from "./pass.js";
 
+/**
+ * Concatenate two optional metadata lists, reusing whichever side is the only
+ * non-empty one instead of copying it (and allocating nothing when both are
+ * empty). Metadata is never mutated in place, so sharing the array is safe.
+ */
+function concatLists<T>(parent?: T[], child?: T[]): T[] | undefined {
+  if (!parent?.length) return child?.length ? child : undefined;
+  if (!child?.length) return parent;
+  return [...parent, ...child];
+}
+
+/**
+ * Merge the docs of a collapsed wrapper and its surviving child (innermost
+ * scalar fields win, lists concatenate). When only one layer is documented -
+ * the common case - its `Documentation` is reused as is rather than copied.
+ */
+function mergeDoc(parent?: Documentation, child?: Documentation): Documentation | undefined {
+  if (!parent) return child;
+  if (!child) return parent;
+  return {
+    title: child.title ?? parent.title,
+    description: child.description ?? parent.description,
+    authors: concatLists(parent.authors, child.authors),
+    literature: concatLists(parent.literature, child.literature),
+    urls: concatLists(parent.urls, child.urls),
+    comment: child.comment ?? parent.comment,
+  };
+}
+
+/**
+ * Would merging `layer` into `other` leave `other`'s meta unchanged? `role` is
+ * which side of `mergeMeta` the layer is on: the child wins `name`,
+ * `defaultValue` and doc scalars, the parent wins `variantTag`, and docs and
+ * outputs from either side always contribute.
+ */
+function addsNothing(layer: NodeMeta, other: NodeMeta, role: "parent" | "child"): boolean {
+  if (layer.doc || layer.outputs?.length) return false;
+  const loses = (mine: unknown, theirs: unknown, theyWin: boolean): boolean =>
+    mine === undefined || (theyWin && theirs !== undefined);
+  return (
+    loses(layer.name, other.name, role === "parent") &&
+    loses(layer.defaultValue, other.defaultValue, role === "parent") &&
+    loses(layer.variantTag, other.variantTag, role === "child")
+  );
+}
+
 /**
  * Merge two `NodeMeta` when collapsing a wrapper layer (the child is the
  * inner/surviving node). Name, doc fields and defaultValue take the innermost
@@ -12,6 +59,11 @@ function mergeMeta(parent?: NodeMeta, child?: NodeMeta): NodeMeta | undefined {
   if (!parent && !child) return undefined;
   if (!parent) return child;
   if (!child) return parent;
+  // When one layer only carries fields the other already overrides (commonly
+  // just a `name` the inner node shadows), the other layer's meta already is
+  // the merge result and is reused instead of rebuilt.
+  if (addsNothing(parent, child, "parent")) return child;
+  if (addsNothing(child, parent, "child")) return parent;
 
   const merged: NodeMeta = {};
 
@@ -29,19 +81,11 @@ function mergeMeta(parent?: NodeMeta, child?: NodeMeta): NodeMeta | undefined {
   const defaultValue = child.defaultValue ?? parent.defaultValue;
   if (defaultValue !== undefined) merged.defaultValue = defaultValue;
 
-  if (parent.doc || child.doc) {
-    merged.doc = {
-      title: child.doc?.title ?? parent.doc?.title,
-      description: child.doc?.description ?? parent.doc?.description,
-      authors: [...(parent.doc?.authors ?? []), ...(child.doc?.authors ?? [])],
-      literature: [...(parent.doc?.literature ?? []), ...(child.doc?.literature ?? [])],
-      urls: [...(parent.doc?.urls ?? []), ...(child.doc?.urls ?? [])],
-      comment: child.doc?.comment ?? parent.doc?.comment,
-    };
-  }
+  const doc = mergeDoc(parent.doc, child.doc);
+  if (doc) merged.doc = doc;
 
-  const outputs = [...(parent.outputs ?? []), ...(child.outputs ?? [])];
-  if (outputs.length > 0) merged.outputs = outputs;
+  const outputs = concatLists(parent.outputs, child.outputs);
+  if (outputs) merged.outputs = outputs;
 
   return merged;
 }
@@ -116,27 +160,40 @@ export const simplify: Pass = {
           // (e.g. `seq(lit("wb_command"), lit("-foo"))` -> `"wb_command-foo"`).
           // Inside a join context the backend concatenates anyway, so leaving
           // such literals unmerged stays correct (just one node larger).
-          const nodes: Expr[] = [];
-          for (const child of children) {
-            const prev = nodes[nodes.length - 1];
-            if (
-              prev?.kind === "literal" &&
-              child.kind === "literal" &&
-              !prev.meta &&
-              !child.meta &&
-              node.attrs.join === ""
-            ) {
-              changed = true;
-              // Replace with a fresh node - `prev` is the original literal object
-              // (the `literal` case returns `node` unchanged), so mutating it in
-              // place would corrupt the caller's IR and double-append on rerun.
-              nodes[nodes.length - 1] = {
-                ...prev,
-                attrs: { ...prev.attrs, str: prev.attrs.str + child.attrs.str },
-              };
-            } else {
-              nodes.push(child);
+          const canMerge = node.attrs.join === "";
+          // Outside a concatenation context nothing merges, so the visited
+          // children are used as is instead of being copied one by one.
+          const nodes: Expr[] = canMerge ? [] : children;
+          // The strings of the literal run ending at `nodes[nodes.length - 1]`,
+          // joined once when the run ends rather than re-concatenated (and a new
+          // node built) for every absorbed literal.
+          let run: string[] | undefined;
+          const flushRun = (): void => {
+            if (!run) return;
+            // Replace with a fresh node - the run's head is the original literal
+            // object (the `literal` case returns `node` unchanged), so mutating
+            // it in place would corrupt the caller's IR and double-append on rerun.
+            const head = nodes[nodes.length - 1] as Literal;
+            nodes[nodes.length - 1] = { ...head, attrs: { ...head.attrs, str: run.join("") } };
+            run = undefined;
+          };
+          if (canMerge) {
+            for (const child of children) {
+              const prev = nodes[nodes.length - 1];
+              if (
+                prev?.kind === "literal" &&
+                child.kind === "literal" &&
+                !prev.meta &&
+                !child.meta
+              ) {
+                changed = true;
+                (run ??= [prev.attrs.str]).push(child.attrs.str);
+              } else {
+                flushRun();
+                nodes.push(child);
+              }
             }
+            flushRun();
           }
 
           // seq(T) -> T, carrying the seq's meta down onto the child. Skip the
@@ -62,14 +62,26 @@ function isInterpolable(type: BoundType): boolean {
  * lone field's binding onto the scope node itself (e.g. ants DenoiseImage's
  * `correctedOutputFileName` arm), and that binding - with the field's access
  * path and the arm's variant gate - is exactly what the arm's output ref needs.
+ *
+ * When `scopes` is supplied, the same walk also appends every output-carrying
+ * node to it in tree order, so the caller needs no second traversal.
  */
 function indexBindingsByName(
   root: Expr,
   resolve: (n: Expr) => Binding | undefined,
   includeRoot = false,
+  scopes?: ScopeEntry[],
 ): NameIndex {
   const byNameDepth = new Map<string, { binding: Binding; depth: number }>();
-  function walk(node: Expr, depth: number): void {
+  // Pre-order walk off an explicit stack (runs once globally and once per
+  // output scope, so it stays off the call stack for deep descriptors).
+  // Children are pushed in reverse so they pop left-to-right: `scopes` is in
+  // tree order, and the first of two equally deep bindings keeps its name.
+  const stack: [Expr, number][] = [[root, 0]];
+  let entry: [Expr, number] | undefined;
+  while ((entry = stack.pop()) !== undefined) {
+    const [node, depth] = entry;
+    if (scopes && node.meta?.outputs?.length) scopes.push({ node, outputs: node.meta.outputs });
     const binding = resolve(node);
     if (binding && (depth > 0 || includeRoot)) {
       const existing = byNameDepth.get(binding.name);
@@ -79,18 +91,17 @@ function indexBindingsByName(
     }
     switch (node.kind) {
       case "sequence":
-        for (const child of node.attrs.nodes) walk(child, depth + 1);
+      case "alternative": {
+        const children = node.kind === "sequence" ? node.attrs.nodes : node.attrs.alts;
+        for (let i = children.length - 1; i >= 0; i--) stack.push([children[i]!, depth + 1]);
         break;
+      }
       case "optional":
       case "repeat":
-        walk(node.attrs.node, depth + 1);
-        break;
-      case "alternative":
-        for (const alt of node.attrs.alts) walk(alt, depth + 1);
+        stack.push([node.attrs.node, depth + 1]);
         break;
     }
   }
-  walk(root, 0);
   const byName = new Map<string, Binding>();
   for (const [name, { binding }] of byNameDepth) byName.set(name, binding);
   return { byName };
@@ -111,29 +122,10 @@ function preferCandidate(
   return cand.depth < existing.depth;
 }
 
-/**
- * Walk the IR collecting `(node, outputs)` pairs in tree order. Outputs attach
- * to struct/sequence nodes by frontend convention.
- */
-function collectScopes(root: Expr): { node: Expr; outputs: Output[] }[] {
-  const out: { node: Expr; outputs: Output[] }[] = [];
-  function walk(node: Expr): void {
-    if (node.meta?.outputs?.length) out.push({ node, outputs: node.meta.outputs });
-    switch (node.kind) {
-      case "sequence":
-        for (const child of node.attrs.nodes) walk(child);
-        break;
-      case "optional":
-      case "repeat":
-        walk(node.attrs.node);
-        break;
-      case "alternative":
-        for (const alt of node.attrs.alts) walk(alt);
-        break;
-    }
-  }
-  walk(root);
-  return out;
+/** An output-carrying node and its outputs, in tree order. */
+interface ScopeEntry {
+  node: Expr;
+  outputs: Output[];
 }
 
 function resolveOne(
@@ -189,8 +181,11 @@ function resolveOne(
  * node) - it is reported as a diagnostic and dropped.
  */
 export function resolveOutputs(root: Expr, solved: SolveResult): OutputResolution {
-  const names = indexBindingsByName(root, solved.resolve);
-  const collected = collectScopes(root);
+  // One pre-order walk builds the global name index and collects the
+  // output-carrying nodes (outputs attach to struct/sequence nodes by frontend
+  // convention) in tree order.
+  const collected: ScopeEntry[] = [];
+  const names = indexBindingsByName(root, solved.resolve, false, collected);
 
   const byScope = new Map<BindingId, OutputScope>();
   const errors: OutputDiagnostic[] = [];